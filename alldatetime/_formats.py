@@ -0,0 +1,27 @@
+"""Format-string helpers shared by the strftime and strptime engines."""
+
+# Directives that expand to other directives, as in the C locale.
+_ALIASES = {
+    "c": "%a %b %e %H:%M:%S %Y",
+    "x": "%m/%d/%y",
+    "X": "%H:%M:%S",
+    "D": "%m/%d/%y",
+    "F": "%Y-%m-%d",
+    "T": "%H:%M:%S",
+    "R": "%H:%M",
+}
+
+
+def _expand_aliases(format):
+    parts = []
+    i, n = 0, len(format)
+    while i < n:
+        char = format[i]
+        if char == "%" and i + 1 < n:
+            directive = format[i + 1]
+            parts.append(_ALIASES.get(directive, format[i : i + 2]))
+            i += 2
+        else:
+            parts.append(char)
+            i += 1
+    return "".join(parts)
@@ -0,0 +1,212 @@
+"""Strftime-related functions.
+
+Unlike datetime.strftime, the year is not limited to 1..9999.  Every format
+string is compiled once into a %-template and a function extracting its
+arguments, and the compiled formats are cached.  Names are emitted in
+English, independently of the current locale.  Other directives (such as
+'%-d' or '%k') are passed to the platform's datetime.strftime, which limits
+them to years 1 to 9999.
+
+The year policy follows the rest of the library: by default %Y is the
+absolute year and ' BC' or ' AD' is appended to the result.  With era=False,
+%Y is the signed year (as in isoformat) and nothing is appended.
+"""
+
+from datetime import datetime as _datetime
+from functools import lru_cache as _lru_cache
+from functools import partial as _partial
+from operator import itemgetter as _itemgetter
+
+from alldatetime._formats import _expand_aliases
+from alldatetime.alldatetime import (
+    ADENDING,
+    BCENDING,
+    _DAYS_BEFORE_MONTH,
+    _is_leap,
+    _ord2ymd,
+    _ymd2ord_unchecked,
+)
+
+_MONTHNAMES = (
+    None,
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_DAYNAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# Indexes into the tuple every formatted value is reduced to:
+# (abs(year), month, day, hour, minute, second, microsecond, ordinal, year).
+_ABSYEAR = 0
+_MONTH = 1
+_DAY = 2
+_HOUR = 3
+_MINUTE = 4
+_SECOND = 5
+_MICROSECOND = 6
+_ORDINAL = 7
+_YEAR = 8
+
+
+def _yday(f):
+    "Day of the year, 1-based."
+    return (
+        _DAYS_BEFORE_MONTH[f[_MONTH]]
+        + (f[_MONTH] > 2 and _is_leap(f[_YEAR]))
+        + f[_DAY]
+    )
+
+
+def _format_signed(year):
+    return ("%04d" if year > 0 else "%05d") % year
+
+
+def _signed_year(f):
+    return _format_signed(f[_YEAR])
+
+
+def _iso_year_week(f):
+    "ISO year and ISO week number, the year being that of the week's Thursday."
+    thursday = f[_ORDINAL] - f[_ORDINAL] % 7 + 3
+    year = _ord2ymd(thursday)[0]
+    return year, (thursday - _ymd2ord_unchecked(year, 1, 1)) // 7 + 1
+
+
+def _signed_iso_year(f):
+    return _format_signed(_iso_year_week(f)[0])
+
+
+# directive -> (%-spec, source).  The source is either an index into the
+# fields tuple or a function of it.
+_DIRECTIVES = {
+    "Y": ("%04d", _ABSYEAR),
+    "y": ("%02d", lambda f: f[_ABSYEAR] % 100),
+    "C": ("%02d", lambda f: f[_ABSYEAR] // 100),
+    "m": ("%02d", _MONTH),
+    "d": ("%02d", _DAY),
+    "e": ("%2d", _DAY),
+    "H": ("%02d", _HOUR),
+    "I": ("%02d", lambda f: f[_HOUR] % 12 or 12),
+    "p": ("%s", lambda f: "AM" if f[_HOUR] < 12 else "PM"),
+    "M": ("%02d", _MINUTE),
+    "S": ("%02d", _SECOND),
+    "f": ("%06d", _MICROSECOND),
+    "j": ("%03d", _yday),
+    "a": ("%s", lambda f: _DAYNAMES[f[_ORDINAL] % 7][:3]),
+    "A": ("%s", lambda f: _DAYNAMES[f[_ORDINAL] % 7]),
+    "b": ("%s", lambda f: _MONTHNAMES[f[_MONTH]][:3]),
+    "h": ("%s", lambda f: _MONTHNAMES[f[_MONTH]][:3]),
+    "B": ("%s", lambda f: _MONTHNAMES[f[_MONTH]]),
+    "w": ("%d", lambda f: (f[_ORDINAL] + 1) % 7),
+    "u": ("%d", lambda f: f[_ORDINAL] % 7 + 1),
+    "U": ("%02d", lambda f: (_yday(f) + 6 - (f[_ORDINAL] + 1) % 7) // 7),
+    "W": ("%02d", lambda f: (_yday(f) + 6 - f[_ORDINAL] % 7) // 7),
+    "G": ("%04d", lambda f: abs(_iso_year_week(f)[0])),
+    "V": ("%02d", lambda f: _iso_year_week(f)[1]),
+}
+# Flags, width and modifiers of platform directives, as in '%-d' or '%Ey'.
+_FLAGS = "-_0^#123456789EO"
+
+
+def _platform(directive, f):
+    """Format fields f with a directive of the platform's datetime.strftime,
+    for the directives without a native implementation.  As datetime is
+    limited, only years 1 to 9999 (AD or BC) are supported."""
+    if not 1 <= f[_ABSYEAR] <= 9999:
+        raise ValueError(
+            "directive %r is only supported for years 1 to 9999" % directive
+        )
+    return _datetime(
+        f[_ABSYEAR],
+        f[_MONTH],
+        f[_DAY],
+        f[_HOUR],
+        f[_MINUTE],
+        f[_SECOND],
+        f[_MICROSECOND],
+    ).strftime(directive)
+
+
+@_lru_cache(maxsize=256)
+def _compile(format, era=True):
+    """format -> (template for AD years, template for BC years, getter).
+
+    Formatting fields f is then template % getter(f).
+    """
+    format = _expand_aliases(format)
+    template = []
+    sources = []
+    i, n = 0, len(format)
+    while i < n:
+        char = format[i]
+        i += 1
+        if char != "%":
+            template.append(char)
+            continue
+        if i == n:
+            raise ValueError("stray %% in format %r" % format)
+        start = i
+        while i < n - 1 and format[i] in _FLAGS:
+            i += 1
+        directive = format[start : i + 1]
+        i += 1
+        if directive == "%":
+            template.append("%%")
+            continue
+        if directive in ("z", "Z"):
+            # Values are naive: like datetime.strftime, emit nothing.
+            continue
+        if directive == "Y" and not era:
+            spec, source = "%s", _signed_year
+        elif directive == "G" and not era:
+            spec, source = "%s", _signed_iso_year
+        elif directive in _DIRECTIVES:
+            spec, source = _DIRECTIVES[directive]
+        else:
+            spec, source = "%s", _partial(_platform, "%" + directive)
+        template.append(spec)
+        sources.append(source)
+
+    template = "".join(template)
+    if not sources:
+        getter = lambda f: ()
+    elif all(isinstance(source, int) for source in sources):
+        getter = _itemgetter(*sources)
+        if len(sources) == 1:
+            getter = lambda f, getter=getter: (getter(f),)
+    else:
+        sources = [
+            _itemgetter(source) if isinstance(source, int) else source
+            for source in sources
+        ]
+        getter = lambda f: tuple([source(f) for source in sources])
+    if era:
+        return template + ADENDING, template + BCENDING, getter
+    return template, template, getter
+
+
+def _strftime(fields, format, era=True):
+    """Format fields according to format.
+
+    fields is (year, month, day, hour, minute, second, microsecond, ordinal).
+    """
+    ad, bc, getter = _compile(format, era)
+    year = fields[0]
+    return (ad if year > 0 else bc) % getter((abs(year),) + fields[1:] + (year,))
@@ -0,0 +1,277 @@
+"""Strptime-related functions.
+
+Unlike datetime.strptime, the year is not limited to 1..9999: %Y accepts any
+number of digits and a sign, and a trailing ' BC' or ' AD' (or a leading
+'-') marks the era.  Month and weekday names are matched in English,
+independently of the current locale.  Time zones (%z and %Z) are matched
+and ignored, as the parsed values are naive.
+
+Every format string is compiled once into a regular expression, and the
+compiled formats are cached.
+"""
+
+import re as _re
+from functools import lru_cache as _lru_cache
+
+from alldatetime._formats import _expand_aliases
+from alldatetime.alldatetime import (
+    _check_year,
+    _days_in_month,
+    _ord2ymd,
+    _ymd2ord_unchecked,
+)
+
+_MONTHS = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+_MONTH_NUMBERS = {}
+for _i, _name in enumerate(_MONTHS, 1):
+    _MONTH_NUMBERS[_name] = _MONTH_NUMBERS[_name[:3]] = _i
+_WEEKDAY_NUMBERS = {}
+for _i, _name in enumerate(_WEEKDAYS):
+    _WEEKDAY_NUMBERS[_name] = _WEEKDAY_NUMBERS[_name[:3]] = _i
+del _i, _name
+
+
+def _names_pattern(names):
+    alternatives = sorted(set(names) | {name[:3] for name in names}, key=len)
+    return "|".join(reversed(alternatives))
+
+
+_DIRECTIVES = {
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "e": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "f": r"(?P<f>\d{1,6})",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "I": r"(?P<I>1[0-2]|0[1-9]|[1-9])",
+    "j": r"(?P<j>36[0-6]|3[0-5]\d|[12]\d\d|0[1-9]\d|00[1-9]|[1-9]\d|0[1-9]|[1-9])",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>[0-5]\d|\d)",
+    "y": r"(?P<y>\d\d)",
+    "Y": r"(?P<Y>[+-]?\d+)",
+    "G": r"(?P<G>[+-]?\d+)",
+    "V": r"(?P<V>5[0-3]|0[1-9]|[1-4]\d|[1-9])",
+    "U": r"(?P<U>5[0-3]|[0-4]\d|\d)",
+    "W": r"(?P<W>5[0-3]|[0-4]\d|\d)",
+    "w": r"(?P<w>[0-6])",
+    "u": r"(?P<u>[1-7])",
+    "b": r"(?P<b>%s)" % _names_pattern(_MONTHS),
+    "B": r"(?P<b>%s)" % _names_pattern(_MONTHS),
+    "h": r"(?P<b>%s)" % _names_pattern(_MONTHS),
+    "a": r"(?P<a>%s)" % _names_pattern(_WEEKDAYS),
+    "A": r"(?P<a>%s)" % _names_pattern(_WEEKDAYS),
+    "p": r"(?P<p>am|pm)",
+    # Time zones are matched and ignored: the parsed values are naive.
+    "z": r"(?:[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|Z)",
+    # An era is not a zone name: '%Y %Z' does not match '44 BC'.
+    "Z": r"(?:(?!(?:BC|AD)\b)[a-z][\w/+-]*)",
+    "%": "%",
+}
+# Directives sharing the group of another directive.
+_GROUPS = {"e": "d", "B": "b", "h": "b", "A": "a"}
+# When %Y (or %G) is immediately followed by another directive, as in
+# '%Y%m%d', the year takes at least four digits and as few as possible.
+_COMPACT_YEARS = {
+    "Y": r"(?P<Y>[+-]?\d{4,}?)",
+    "G": r"(?P<G>[+-]?\d{4,}?)",
+}
+
+_ERA = r"(?:\s*(?P<era>BC|AD))?"
+
+
+@_lru_cache(maxsize=256)
+def _compile(format):
+    "format -> compiled regular expression matching strings in that format."
+    expanded = _expand_aliases(format)
+    parts = []
+    seen = set()
+    i, n = 0, len(expanded)
+    while i < n:
+        char = expanded[i]
+        i += 1
+        if char != "%":
+            parts.append(r"\s+" if char.isspace() else _re.escape(char))
+            continue
+        if i == n:
+            raise ValueError("stray %% in format %r" % format)
+        directive = expanded[i]
+        i += 1
+        try:
+            pattern = _DIRECTIVES[directive]
+        except KeyError:
+            raise ValueError(
+                "%r is a bad directive in format %r" % (directive, format)
+            ) from None
+        if directive in _COMPACT_YEARS and expanded[i : i + 1] == "%":
+            if expanded[i + 1 : i + 2] != "%":
+                pattern = _COMPACT_YEARS[directive]
+        group = _GROUPS.get(directive, directive)
+        if group in seen and "?P<" in pattern:
+            raise ValueError(
+                "directive %%%s is repeated in format %r" % (directive, format)
+            )
+        seen.add(group)
+        parts.append(pattern)
+    sign = "" if expanded.startswith(("%Y", "%G")) else "(?P<sign>-)?"
+    return _re.compile(
+        r"\s*" + sign + "".join(parts) + _ERA + r"\s*\Z", _re.IGNORECASE
+    )
+
+
+def _strptime(data_string, format):
+    """Parse data_string according to format.
+
+    Returns (year, month, day, hour, minute, second, microsecond), with the
+    same defaults as datetime.strptime (1900-01-01 00:00:00).  The fields are
+    not validated against each other (e.g. February 30 is returned as is).
+    """
+    if not isinstance(data_string, str):
+        raise TypeError("strptime() argument 1 must be str")
+    found = _compile(format).match(data_string)
+    if found is None:
+        raise ValueError(
+            "time data %r does not match format %r" % (data_string, format)
+        )
+    groups = found.groupdict()
+
+    year = 1900
+    if groups.get("Y") is not None:
+        year = int(groups["Y"])
+    elif groups.get("y") is not None:
+        year = int(groups["y"])
+        # Open Group specification for strptime() states that a %y value in
+        # the range of [00, 68] is in the century 2000, while [69,99] is in
+        # the century 1900.
+        year += 2000 if year <= 68 else 1900
+    era = (groups.get("era") or "").upper()
+    negative = groups.get("sign") or any(
+        (groups.get(group) or "").startswith("-") for group in ("Y", "G")
+    )
+    if negative and era == "AD":
+        raise ValueError(
+            "time data %r has both a minus sign and the AD era" % data_string
+        )
+    bc = negative or era == "BC"
+    if bc:
+        year = -abs(year)
+
+    month = day = None
+    if groups.get("m") is not None:
+        month = int(groups["m"])
+    elif groups.get("b") is not None:
+        month = _MONTH_NUMBERS[groups["b"].lower()]
+    if groups.get("d") is not None:
+        day = int(groups["d"])
+
+    weekday = None
+    if groups.get("a") is not None:
+        weekday = _WEEKDAY_NUMBERS[groups["a"].lower()]
+    elif groups.get("w") is not None:
+        weekday = (int(groups["w"]) + 6) % 7
+    elif groups.get("u") is not None:
+        weekday = int(groups["u"]) - 1
+
+    # As in datetime.strptime, a week number and a weekday take precedence
+    # over the month and the day, and %G is only meaningful with %V.
+    if groups.get("G") is not None:
+        if groups.get("V") is None or weekday is None:
+            raise ValueError(
+                "ISO year directive '%G' must be used with the ISO week "
+                "directive '%V' and a weekday directive"
+            )
+        year = int(groups["G"])
+        if bc:
+            year = -abs(year)
+        ordinal = _iso_week_to_ordinal(year, int(groups["V"]), weekday)
+        year, month, day = _ord2ymd(ordinal)
+    elif groups.get("V") is not None:
+        raise ValueError(
+            "ISO week directive '%V' must be used with the ISO year directive "
+            "'%G' and a weekday directive"
+        )
+    elif groups.get("j") is not None:
+        if month is None or day is None:
+            month, day = _julian_to_month_day(year, int(groups["j"]))
+    elif weekday is not None and groups.get("U") is not None:
+        year, month, day = _week_to_ymd(year, int(groups["U"]), weekday, False)
+    elif weekday is not None and groups.get("W") is not None:
+        year, month, day = _week_to_ymd(year, int(groups["W"]), weekday, True)
+    month = month or 1
+    day = day or 1
+
+    hour = 0
+    if groups.get("H") is not None:
+        hour = int(groups["H"])
+    elif groups.get("I") is not None:
+        hour = int(groups["I"]) % 12
+        if (groups.get("p") or "").lower() == "pm":
+            hour += 12
+    minute = int(groups["M"]) if groups.get("M") is not None else 0
+    second = int(groups["S"]) if groups.get("S") is not None else 0
+    microsecond = 0
+    if groups.get("f") is not None:
+        fraction = groups["f"]
+        microsecond = int(fraction) * 10 ** (6 - len(fraction))
+    return year, month, day, hour, minute, second, microsecond
+
+
+def _julian_to_month_day(year, julian):
+    "year, day of the year (1-based) -> (month, day)."
+    for month in range(1, 13):
+        dim = _days_in_month(year, month)
+        if julian <= dim:
+            return month, julian
+        julian -= dim
+    raise ValueError("day of the year is out of range for year %d" % year)
+
+
+def _week_to_ymd(year, week, weekday, monday_first):
+    """year, week number (%U or %W), weekday (Monday is 0) -> (year, month, day).
+
+    Week 0 holds the days before the first Sunday (%U) or Monday (%W) of the
+    year; days it would hold before January 1 fall in the previous year.
+    """
+    first = _ymd2ord_unchecked(_check_year(year), 1, 1)
+    first_weekday = first % 7
+    if not monday_first:
+        first_weekday = (first_weekday + 1) % 7
+        weekday = (weekday + 1) % 7
+    if week == 0:
+        julian = 1 + weekday - first_weekday
+    else:
+        julian = 1 + (7 - first_weekday) % 7 + 7 * (week - 1) + weekday
+    return _ord2ymd(first + julian - 1)
+
+
+def _iso_week_to_ordinal(year, week, weekday):
+    "ISO year, ISO week, weekday (Monday is 0) -> ordinal."
+    # Week 1 is the week holding January 4.
+    january4 = _ymd2ord_unchecked(_check_year(year), 1, 4)
+    ordinal = january4 - january4 % 7 + 7 * (week - 1) + weekday
+    if week == 53:
+        next_january4 = _ymd2ord_unchecked(year + 1 if year != -1 else 1, 1, 4)
+        if ordinal >= next_january4 - next_january4 % 7:
+            raise ValueError("ISO week 53 is out of range for ISO year %d" % year)
+    return ordinal
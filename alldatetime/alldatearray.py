@@ -0,0 +1,208 @@
+from array import array
+from datetime import timedelta
+from operator import index as _index
+
+from alldatetime.alldatetime import (
+    _check_date_fields,
+    _format_date,
+    _ord2ymd,
+    _ymd2ord_unchecked,
+    alldate,
+)
+from alldatetime import vectorized as _vectorized
+
+__all__ = ("alldatearray",)
+
+
+class alldatearray:
+    """
+    A compact column of dates, stored as day ordinals in an array('q').
+
+    Each date costs 8 bytes instead of a full alldate object.  Elements are
+    only materialized as alldate instances when they are indexed or iterated.
+    Ordinals must fit in a signed 64-bit integer.
+    """
+
+    __slots__ = ("_ordinals",)
+
+    def __init__(self, dates=()):
+        ordinals = array("q")
+        for date in dates:
+            if not isinstance(date, alldate):
+                raise TypeError("dates should be of type alldate.")
+            ordinals.append(date.toordinal())
+        self._ordinals = ordinals
+
+    @classmethod
+    def _from_array(cls, ordinals: array):
+        self = object.__new__(cls)
+        self._ordinals = ordinals
+        return self
+
+    @classmethod
+    def fromordinals(cls, ordinals):
+        """Construct an array from an iterable or buffer of day ordinals.
+
+        January 1 of year 1 is day 0.
+        """
+        if isinstance(ordinals, array) and ordinals.typecode == "q":
+            return cls._from_array(array("q", ordinals))
+        return cls._from_array(array("q", map(_index, ordinals)))
+
+    @classmethod
+    def fromcolumns(cls, years, months, days, validate: bool = True):
+        """Construct an array from parallel year, month and day columns.
+
+        With validate=False the fields are trusted as-is, see
+        alldate.fromcolumns.  The conversion is vectorized when NumPy is
+        installed and the columns are integer arrays.
+        """
+        if _vectorized.available:
+            ordinals = cls._ymd_to_ordinals(years, months, days, validate)
+            if ordinals is not None:
+                return cls._from_array(ordinals)
+        if validate:
+            ordinals = array(
+                "q",
+                (
+                    _ymd2ord_unchecked(*_check_date_fields(y, m, d))
+                    for y, m, d in zip(years, months, days)
+                ),
+            )
+        else:
+            ordinals = array(
+                "q",
+                (_ymd2ord_unchecked(y, m, d) for y, m, d in zip(years, months, days)),
+            )
+        return cls._from_array(ordinals)
+
+    @staticmethod
+    def _ymd_to_ordinals(years, months, days, validate):
+        """Vectorized conversion for fromcolumns.
+
+        Returns None when the columns are not plain integer arrays of the
+        same length, or when some date is invalid, so that the scalar path
+        handles them (and raises the usual errors).
+        """
+        try:
+            if not len(years) == len(months) == len(days):
+                return None
+            ordinals, valid = _vectorized.ymd_to_ordinal(years, months, days)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if ordinals.ndim != 1 or validate and not valid.all():
+            return None
+        result = array("q")
+        result.frombytes(ordinals.tobytes())
+        return result
+
+    @property
+    def ordinals(self) -> array:
+        """The underlying array('q') of day ordinals.
+
+        It supports the buffer protocol, so memoryview(arr.ordinals) gives a
+        zero-copy view of the column.
+        """
+        return self._ordinals
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_array(self._ordinals[index])
+        return alldate._from_ordinal(self._ordinals[index])
+
+    def __iter__(self):
+        from_ordinal = alldate._from_ordinal
+        for n in self._ordinals:
+            yield from_ordinal(n)
+
+    def __eq__(self, other):
+        if isinstance(other, alldatearray):
+            return self._ordinals == other._ordinals
+        return NotImplemented
+
+    __hash__ = None
+
+    def _other_ordinals(self, other):
+        if isinstance(other, alldate):
+            n = other.toordinal()
+            return [n] * len(self._ordinals)
+        if isinstance(other, alldatearray):
+            if len(other) != len(self):
+                raise ValueError("arrays should have the same length.")
+            return other._ordinals
+        raise TypeError("other should be of type alldate or alldatearray.")
+
+    # Elementwise comparisons with an alldate or an alldatearray of the same
+    # length.  Each returns a list of bools.
+
+    def eq(self, other) -> list:
+        return [a == b for a, b in zip(self._ordinals, self._other_ordinals(other))]
+
+    def ne(self, other) -> list:
+        return [a != b for a, b in zip(self._ordinals, self._other_ordinals(other))]
+
+    def lt(self, other) -> list:
+        return [a < b for a, b in zip(self._ordinals, self._other_ordinals(other))]
+
+    def le(self, other) -> list:
+        return [a <= b for a, b in zip(self._ordinals, self._other_ordinals(other))]
+
+    def gt(self, other) -> list:
+        return [a > b for a, b in zip(self._ordinals, self._other_ordinals(other))]
+
+    def ge(self, other) -> list:
+        return [a >= b for a, b in zip(self._ordinals, self._other_ordinals(other))]
+
+    def __add__(self, other):
+        "Add a timedelta to every date."
+        if isinstance(other, timedelta):
+            days = other.days
+            return self._from_array(array("q", [n + days for n in self._ordinals]))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtract a timedelta from every date, or subtract an alldate or an
+        alldatearray of the same length, giving an array('q') of days."""
+        if isinstance(other, timedelta):
+            days = other.days
+            return self._from_array(array("q", [n - days for n in self._ordinals]))
+        if isinstance(other, (alldate, alldatearray)):
+            return array(
+                "q",
+                [a - b for a, b in zip(self._ordinals, self._other_ordinals(other))],
+            )
+        return NotImplemented
+
+    def weekdays(self) -> array:
+        "Return the day of the week of every date, where Monday == 0 ... Sunday == 6."
+        return array("b", [n % 7 for n in self._ordinals])
+
+    def tocolumns(self) -> tuple:
+        """Return the dates as (years, months, days) columns.
+
+        The columns are NumPy arrays when NumPy is installed, and lists
+        otherwise.
+        """
+        if _vectorized.available:
+            return _vectorized.ordinal_to_ymd(self._as_ndarray())
+        if not self._ordinals:
+            return [], [], []
+        years, months, days = zip(*map(_ord2ymd, self._ordinals))
+        return list(years), list(months), list(days)
+
+    def _as_ndarray(self):
+        return _vectorized.frombuffer(self._ordinals)
+
+    def isoformat(self) -> list:
+        "Return every date formatted according to ISO."
+        if _vectorized.available and self._ordinals:
+            years, months, days = _vectorized.ordinal_to_ymd(self._as_ndarray())
+            return list(
+                map(_format_date, years.tolist(), months.tolist(), days.tolist())
+            )
+        return [_format_date(*_ord2ymd(n)) for n in self._ordinals]
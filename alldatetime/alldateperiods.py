@@ -0,0 +1,551 @@
+from bisect import bisect_right as _bisect_right
+from heapq import merge as _merge_sorted
+from random import random as _random
+
+from alldatetime.alldatetime import alldate, alldateperiod
+
+__all__ = ("alldateperiodcoverage", "alldateperiodindex", "alldateperiodset")
+
+
+class _Node:
+    __slots__ = "start", "end", "items", "priority", "maxend", "left", "right"
+
+    def __init__(self, start, end, items, priority):
+        self.start = start
+        self.end = end
+        self.items = items
+        self.priority = priority
+        self.maxend = end
+        self.left = None
+        self.right = None
+
+    def update(self):
+        maxend = self.end
+        if self.left is not None and self.left.maxend > maxend:
+            maxend = self.left.maxend
+        if self.right is not None and self.right.maxend > maxend:
+            maxend = self.right.maxend
+        self.maxend = maxend
+
+
+def _rotate_right(node):
+    left = node.left
+    node.left = left.right
+    left.right = node
+    node.update()
+    left.update()
+    return left
+
+
+def _rotate_left(node):
+    right = node.right
+    node.right = right.left
+    right.left = node
+    node.update()
+    right.update()
+    return right
+
+
+def _merge(left, right):
+    "Merge two treaps, where all keys of left are lower than those of right."
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update()
+        return left
+    right.left = _merge(left, right.left)
+    right.update()
+    return right
+
+
+class _IntervalTree:
+    """
+    An augmented interval tree over half-open integer intervals [start, end).
+
+    It is a treap keyed by (start, end), where every node also keeps the
+    maximum end of its subtree.  Items sharing the same interval are kept
+    in one node.  Insertion and removal take O(log n) expected time, and
+    overlap and containment queries O(log n + k).  Queries for intervals
+    within a range only prune on start, and take O(log n + m), where m is
+    the number of intervals starting in the range.
+    """
+
+    __slots__ = "_root", "_len"
+
+    def __init__(self, intervals=()):
+        "intervals is an iterable of (start, end, item)."
+        self._root = None
+        self._len = 0
+        groups = []
+        for start, end, item in sorted(intervals, key=lambda t: (t[0], t[1])):
+            if groups and groups[-1][0] == start and groups[-1][1] == end:
+                groups[-1][2].append(item)
+            else:
+                groups.append((start, end, [item]))
+            self._len += 1
+        # Random priorities, handed out in decreasing order from the root
+        # down, keep the heap property of the balanced tree built below.
+        priorities = sorted((_random() for _ in groups), reverse=True)
+        self._root = self._build(groups, priorities)
+
+    @staticmethod
+    def _build(groups, priorities):
+        if not groups:
+            return None
+        root = None
+        # Breadth-first over (lo, hi, parent, is_left) ranges of groups.
+        pending = [(0, len(groups), None, False)]
+        index = 0
+        while index < len(pending):
+            lo, hi, parent, is_left = pending[index]
+            mid = (lo + hi) // 2
+            start, end, items = groups[mid]
+            node = _Node(start, end, items, priorities[index])
+            index += 1
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if lo < mid:
+                pending.append((lo, mid, node, True))
+            if mid + 1 < hi:
+                pending.append((mid + 1, hi, node, False))
+        # Fix up the maximum ends bottom-up, children before parents.
+        nodes = [root]
+        for node in nodes:
+            if node.left is not None:
+                nodes.append(node.left)
+            if node.right is not None:
+                nodes.append(node.right)
+        for node in reversed(nodes):
+            node.update()
+        return root
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        "Yield (start, end, item) in (start, end) order."
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                for item in node.items:
+                    yield node.start, node.end, item
+                node = node.right
+
+    def insert(self, start, end, item):
+        self._root = self._insert(self._root, start, end, item)
+        self._len += 1
+
+    def _insert(self, node, start, end, item):
+        if node is None:
+            return _Node(start, end, [item], _random())
+        if start == node.start and end == node.end:
+            node.items.append(item)
+            return node
+        if (start, end) < (node.start, node.end):
+            node.left = self._insert(node.left, start, end, item)
+            if node.left.priority > node.priority:
+                return _rotate_right(node)
+        else:
+            node.right = self._insert(node.right, start, end, item)
+            if node.right.priority > node.priority:
+                return _rotate_left(node)
+        node.update()
+        return node
+
+    def remove(self, start, end, item):
+        "Remove one item equal to item from [start, end); raise KeyError if absent."
+        self._root = self._remove(self._root, start, end, item)
+        self._len -= 1
+
+    def _remove(self, node, start, end, item):
+        if node is None:
+            raise KeyError(item)
+        if start == node.start and end == node.end:
+            try:
+                node.items.remove(item)
+            except ValueError:
+                raise KeyError(item) from None
+            if node.items:
+                return node
+            return _merge(node.left, node.right)
+        if (start, end) < (node.start, node.end):
+            node.left = self._remove(node.left, start, end, item)
+        else:
+            node.right = self._remove(node.right, start, end, item)
+        node.update()
+        return node
+
+    def overlapping(self, start, end):
+        """Return the items whose interval overlaps [start, end), in
+        (start, end) order."""
+        result = []
+        self._overlapping(self._root, start, end, result)
+        return result
+
+    def _overlapping(self, node, start, end, result):
+        if node is None or node.maxend <= start:
+            return
+        self._overlapping(node.left, start, end, result)
+        if node.start < end:
+            if node.end > start:
+                result.extend(node.items)
+            self._overlapping(node.right, start, end, result)
+
+    def containing(self, start, end):
+        """Return the items whose interval contains [start, end), in
+        (start, end) order."""
+        result = []
+        self._containing(self._root, start, end, result)
+        return result
+
+    def _containing(self, node, start, end, result):
+        if node is None or node.maxend < end:
+            return
+        self._containing(node.left, start, end, result)
+        if node.start <= start:
+            if node.end >= end:
+                result.extend(node.items)
+            self._containing(node.right, start, end, result)
+
+    def within(self, start, end):
+        """Return the items whose interval lies within [start, end), in
+        (start, end) order.
+
+        Every interval starting in [start, end] is visited, including those
+        ending after end: this takes O(log n + m), not O(log n + k).
+        """
+        result = []
+        self._within(self._root, start, end, result)
+        return result
+
+    def _within(self, node, start, end, result):
+        if node is None:
+            return
+        if node.start >= start:
+            self._within(node.left, start, end, result)
+            if node.start > end:
+                return
+            if node.end <= end:
+                result.extend(node.items)
+        self._within(node.right, start, end, result)
+
+
+def _period_ordinals(period):
+    if not isinstance(period, alldateperiod):
+        raise ValueError("period should be of type alldateperiod.")
+    return period.start_date.toordinal(), period.end_date.toordinal()
+
+
+class alldateperiodindex:
+    """
+    An index over alldateperiod values answering overlap and cover queries.
+
+    The periods are kept in an augmented interval tree keyed by their start
+    and end ordinals.  Building the index from n periods takes O(n log n);
+    inserting or removing a period takes O(log n), and a query returning k
+    periods takes O(log n + k).
+    """
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, periods=()):
+        self._tree = _IntervalTree(
+            _period_ordinals(period) + (period,) for period in periods
+        )
+
+    def __len__(self):
+        return len(self._tree)
+
+    def __iter__(self):
+        "Iterate over the periods, ordered by start date then end date."
+        for _, _, period in self._tree:
+            yield period
+
+    def insert(self, period: alldateperiod):
+        start, end = _period_ordinals(period)
+        self._tree.insert(start, end, period)
+
+    def remove(self, period: alldateperiod):
+        """Remove a period equal to period.
+
+        Raise ValueError if there is no such period in the index.
+        """
+        start, end = _period_ordinals(period)
+        try:
+            self._tree.remove(start, end, period)
+        except KeyError:
+            raise ValueError("period is not in the index.") from None
+
+    def overlapping(self, period: alldateperiod) -> list:
+        """Return the periods that overlap with period (see
+        alldateperiod.overlap_with), ordered by start date then end date."""
+        start, end = _period_ordinals(period)
+        return self._tree.overlapping(start, end)
+
+    def covering(self, date: alldate) -> list:
+        """Return the periods that cover date (see alldateperiod.cover),
+        ordered by start date then end date."""
+        if not isinstance(date, alldate):
+            raise ValueError("date should be of type alldate.")
+        n = date.toordinal()
+        return self._tree.overlapping(n, n + 1)
+
+
+def _coalesce(runs):
+    """Sweep (start, end) runs sorted by start into disjoint runs.
+
+    Overlapping and adjacent runs are merged, and empty runs are dropped.
+    Returns the lists of starts and ends.
+    """
+    starts = []
+    ends = []
+    for start, end in runs:
+        if start >= end:
+            continue
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class alldateperiodset:
+    """
+    A set of dates, represented as sorted, disjoint and non-adjacent runs of
+    ordinals.
+
+    It is built from alldateperiod values, whose overlapping or adjacent
+    periods are coalesced, and is immutable: set operations return new
+    instances.  Set operations are linear in the number of runs, and
+    membership tests take O(log n).
+    """
+
+    __slots__ = "_starts", "_ends"
+
+    def __init__(self, periods=()):
+        self._starts, self._ends = _coalesce(
+            sorted(_period_ordinals(period) for period in periods)
+        )
+
+    @classmethod
+    def _from_runs(cls, starts, ends):
+        self = object.__new__(cls)
+        self._starts = starts
+        self._ends = ends
+        return self
+
+    @classmethod
+    def _coerce(cls, other):
+        if isinstance(other, alldateperiodset):
+            return other
+        return cls(other)
+
+    def __len__(self):
+        "Return the number of disjoint periods."
+        return len(self._starts)
+
+    def __iter__(self):
+        "Iterate over the disjoint periods as alldateperiod, in order."
+        from_ordinal = alldate._from_ordinal
+        for start, end in zip(self._starts, self._ends):
+            yield alldateperiod(from_ordinal(start), from_ordinal(end))
+
+    def __eq__(self, other):
+        if isinstance(other, alldateperiodset):
+            return self._starts == other._starts and self._ends == other._ends
+        return NotImplemented
+
+    def cover(self, date: alldate) -> bool:
+        "Check whether one of the periods covers date."
+        if not isinstance(date, alldate):
+            raise ValueError("date should be of type alldate.")
+        n = date.toordinal()
+        i = _bisect_right(self._starts, n) - 1
+        return i >= 0 and n < self._ends[i]
+
+    def __contains__(self, date):
+        return isinstance(date, alldate) and self.cover(date)
+
+    def total_days(self) -> int:
+        "Return the number of days covered by the set."
+        return sum(self._ends) - sum(self._starts)
+
+    def union(self, other):
+        "Return the dates covered by self or other."
+        other = self._coerce(other)
+        return self._from_runs(
+            *_coalesce(
+                _merge_sorted(
+                    zip(self._starts, self._ends), zip(other._starts, other._ends)
+                )
+            )
+        )
+
+    def intersection(self, other):
+        "Return the dates covered by both self and other."
+        other = self._coerce(other)
+        a_starts, a_ends = self._starts, self._ends
+        b_starts, b_ends = other._starts, other._ends
+        starts = []
+        ends = []
+        i = j = 0
+        while i < len(a_starts) and j < len(b_starts):
+            start = max(a_starts[i], b_starts[j])
+            end = min(a_ends[i], b_ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if a_ends[i] < b_ends[j]:
+                i += 1
+            else:
+                j += 1
+        return self._from_runs(starts, ends)
+
+    def difference(self, other):
+        "Return the dates covered by self but not by other."
+        other = self._coerce(other)
+        if not self._starts:
+            return self
+        return self.intersection(
+            other._complement(self._starts[0], self._ends[-1])
+        )
+
+    def complement(self, bounds: alldateperiod):
+        "Return the dates within bounds that are not covered by self."
+        start, end = _period_ordinals(bounds)
+        return self._complement(start, end)
+
+    def _complement(self, lo, hi):
+        starts = []
+        ends = []
+        current = lo
+        for i in range(_bisect_right(self._ends, lo), len(self._starts)):
+            start = self._starts[i]
+            if start >= hi:
+                break
+            if start > current:
+                starts.append(current)
+                ends.append(start)
+            current = self._ends[i]
+        if current < hi:
+            starts.append(current)
+            ends.append(hi)
+        return self._from_runs(starts, ends)
+
+    def __or__(self, other):
+        if isinstance(other, alldateperiodset):
+            return self.union(other)
+        return NotImplemented
+
+    def __and__(self, other):
+        if isinstance(other, alldateperiodset):
+            return self.intersection(other)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, alldateperiodset):
+            return self.difference(other)
+        return NotImplemented
+
+
+class alldateperiodcoverage:
+    """
+    Counts how many alldateperiod values are active on given dates.
+
+    A period is active on the dates it covers (see alldateperiod.cover).  The
+    start and end ordinals of the periods are kept in two sorted lists, so
+    that the number of periods active on a date is the number of starts at
+    or before it minus the number of ends at or before it.  Building takes
+    O(n log n); counting m dates takes O(m log n), or O(n + m) if they are
+    sorted.
+    """
+
+    __slots__ = "_starts", "_ends"
+
+    def __init__(self, periods=()):
+        starts = []
+        ends = []
+        for period in periods:
+            start, end = _period_ordinals(period)
+            starts.append(start)
+            ends.append(end)
+        starts.sort()
+        ends.sort()
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self):
+        "Return the number of periods."
+        return len(self._starts)
+
+    def count(self, date: alldate) -> int:
+        "Return the number of periods active on date."
+        if not isinstance(date, alldate):
+            raise ValueError("date should be of type alldate.")
+        n = date.toordinal()
+        return _bisect_right(self._starts, n) - _bisect_right(self._ends, n)
+
+    def counts(self, dates) -> list:
+        "Return the number of periods active on each of dates, in order."
+        ordinals = []
+        for date in dates:
+            if not isinstance(date, alldate):
+                raise ValueError("date should be of type alldate.")
+            ordinals.append(date.toordinal())
+        starts, ends = self._starts, self._ends
+        if any(a > b for a, b in zip(ordinals, ordinals[1:])):
+            return [
+                _bisect_right(starts, n) - _bisect_right(ends, n) for n in ordinals
+            ]
+
+        # Sorted dates: sweep both lists once.
+        result = []
+        i = j = 0
+        nstarts, nends = len(starts), len(ends)
+        for n in ordinals:
+            while i < nstarts and starts[i] <= n:
+                i += 1
+            while j < nends and ends[j] <= n:
+                j += 1
+            result.append(i - j)
+        return result
+
+    def step_function(self) -> list:
+        """Return the number of active periods over time as a list of
+        (alldate, count) pairs, in date order.
+
+        Each count holds from its date up to the date of the next pair; the
+        last count is always 0.
+        """
+        steps = []
+        active = 0
+        starts, ends = self._starts, self._ends
+        i = j = 0
+        while i < len(starts) or j < len(ends):
+            if j == len(ends) or (i < len(starts) and starts[i] < ends[j]):
+                n = starts[i]
+            else:
+                n = ends[j]
+            while i < len(starts) and starts[i] == n:
+                active += 1
+                i += 1
+            while j < len(ends) and ends[j] == n:
+                active -= 1
+                j += 1
+            if not steps or steps[-1][1] != active:
+                steps.append((n, active))
+        return [(alldate._from_ordinal(n), count) for n, count in steps]
@@ -1,13 +1,20 @@
 import math as _math
 import time as _time
-from datetime import date, datetime, time, timedelta
+from datetime import time, timedelta
+from itertools import chain as _chain
+from itertools import islice as _islice
 from operator import index as _index
 
-__all__ = ("alldate", "alltime", "alldatetime")
-
-
-def _cmp(x, y):
-    return 0 if x == y else 1 if x > y else -1
+__all__ = (
+    "alldate",
+    "alltime",
+    "alldatetime",
+    "parse_many",
+    "strftime_many",
+    "strptime_many",
+    "write_isoformat",
+    "write_isoformat_columns",
+)
 
 
 BCENDING = " BC"
@@ -33,6 +40,7 @@ _DAYNAMES = [None, "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 _DAYS_IN_MONTH = [-1, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
 _DAYS_BEFORE_MONTH = [-1]  # -1 is a placeholder for indexing purposes.
 
+SECONDSPERDAY = 86400
 SECONDSPERHOUR = 3600
 SECONDSPERMINUTE = 60
 
@@ -92,12 +100,26 @@ def _days_before_month(year, month):
 _DI400Y = _days_before_year(401)  # number of days in 400 years
 _DI100Y = _days_before_year(101)  #    "    "   "   " 100   "
 _DI4Y = _days_before_year(5)  #    "    "   "   "   4   "
+_EPOCH_ORDINAL = _days_before_year(1970)  # ordinal of 01-Jan-1970
+_US_PER_DAY = SECONDSPERDAY * 1000000
+_EPOCH_US = _EPOCH_ORDINAL * _US_PER_DAY
 
 
 def _ymd2ord(year: int, month: int, day: int) -> int:
     "year, month, day -> ordinal, considering 01-Jan-0001 as day 0."
     year, month, day = _check_date_fields(year, month, day)
-    return _days_before_year(year) + _days_before_month(year, month) + day - 1
+    return _ymd2ord_unchecked(year, month, day)
+
+
+def _ymd2ord_unchecked(year, month, day):
+    "Same as _ymd2ord, for fields that are already known to be valid."
+    return (
+        _days_before_year(year)
+        + _DAYS_BEFORE_MONTH[month]
+        + (month > 2 and _is_leap(year))
+        + day
+        - 1
+    )
 
 
 def _ord2ymd(n):
@@ -166,6 +188,24 @@ def _ord2ymd(n):
     return year, month, n + 1
 
 
+def _local_timestamp(seconds):
+    """UTC wall-clock seconds -> POSIX timestamp of the same wall-clock time
+    in the local timezone.
+
+    The local UTC offset is looked up with time.localtime where the platform
+    supports it, and falls back to time.timezone outside of that range.
+    """
+
+    def utcoffset(t):
+        try:
+            return _time.localtime(t).tm_gmtoff
+        except (OverflowError, OSError, ValueError):
+            return -_time.timezone
+
+    guess = seconds - utcoffset(seconds)
+    return seconds - utcoffset(guess)
+
+
 def _build_struct_time(y, m, d, hh, mm, ss, dstflag):
     wday = (_ymd2ord(y, m, d) + 7) % 7
     dnum = _days_before_month(y, m) + d
@@ -180,6 +220,88 @@ def _days_in_month(year, month):
     return _DAYS_IN_MONTH[month]
 
 
+# Indexed by year > 0.
+_DATE_FORMATS = ("%05d-%02d-%02d", "%04d-%02d-%02d")
+
+
+def _format_date(year, month, day):
+    return _DATE_FORMATS[year > 0] % (year, month, day)
+
+
+def _parse_digits(dtstr, start, end):
+    "dtstr[start:end] -> int, if it is a run of ASCII digits."
+    digits = dtstr[start:end]
+    if len(digits) != end - start or not (digits.isdigit() and digits.isascii()):
+        raise ValueError
+    return int(digits)
+
+
+def _parse_isoformat_date(dtstr):
+    """'[-]YYYY-MM-DD...' -> (year, month, day, end).
+
+    The year has at least four digits and an optional sign; end is the index
+    of the first character after the date.
+    """
+    start = 1 if dtstr[:1] in ("-", "+") else 0
+    pos = dtstr.find("-", start)
+    if pos - start < 4:
+        raise ValueError
+    year = _parse_digits(dtstr, start, pos)
+    if dtstr[:1] == "-":
+        year = -year
+    month = _parse_digits(dtstr, pos + 1, pos + 3)
+    if dtstr[pos + 3 : pos + 4] != "-":
+        raise ValueError
+    day = _parse_digits(dtstr, pos + 4, pos + 6)
+    return year, month, day, pos + 6
+
+
+def _parse_isoformat_time(tstr, pos):
+    """'HH[:MM[:SS[.ffffff]]]' starting at tstr[pos] -> (hh, mm, ss, us).
+
+    The fraction may have 1 to 6 digits.
+    """
+    hh = _parse_digits(tstr, pos, pos + 2)
+    mm = ss = us = 0
+    pos += 2
+    if pos < len(tstr):
+        if tstr[pos] != ":":
+            raise ValueError
+        mm = _parse_digits(tstr, pos + 1, pos + 3)
+        pos += 3
+    if pos < len(tstr):
+        if tstr[pos] != ":":
+            raise ValueError
+        ss = _parse_digits(tstr, pos + 1, pos + 3)
+        pos += 3
+    if pos < len(tstr):
+        ndigits = len(tstr) - pos - 1
+        if tstr[pos] not in ".," or not 1 <= ndigits <= 6:
+            raise ValueError
+        us = _parse_digits(tstr, pos + 1, len(tstr)) * 10 ** (6 - ndigits)
+    return hh, mm, ss, us
+
+
+def _parse_isoformat(dtstr):
+    """Parse the output of alldate.isoformat or alldatetime.isoformat.
+
+    Returns (year, month, day) or (year, month, day, hh, mm, ss, us), with
+    the fields not validated yet.  The date and the time may be separated by
+    a space or 'T'.
+    """
+    if not isinstance(dtstr, str):
+        raise TypeError("fromisoformat: argument must be str")
+    try:
+        year, month, day, pos = _parse_isoformat_date(dtstr)
+        if pos == len(dtstr):
+            return year, month, day
+        if dtstr[pos] not in " T" or pos + 1 == len(dtstr):
+            raise ValueError
+        return (year, month, day) + _parse_isoformat_time(dtstr, pos + 1)
+    except ValueError:
+        raise ValueError("Invalid isoformat string: %r" % dtstr) from None
+
+
 def _check_date_fields(year: int, month: int, day: int) -> tuple[int, int, int]:
     year = _check_year(year)
     month = _check_month(month)
@@ -207,25 +329,45 @@ def _check_time_fields(hour, minute, second, microsecond):
 
 
 class alldate:
-    __slots__ = "_year", "_month", "_day", "_hashcode", "_timestamp"
+    __slots__ = "_ordinal", "_year", "_month", "_day", "_timestamp"
 
     def __init__(self, year: int, month: int, day: int):
         year, month, day = _check_date_fields(year, month, day)
+        self._ordinal = _ymd2ord_unchecked(year, month, day)
         self._year = year
         self._month = month
         self._day = day
-        if year < 0:
-            year += 1
-        self._timestamp = _time.mktime((year, month, day, 0, 0, 0, 0, 0, 0))
-        self._hashcode = -1
+        self._timestamp = None
+
+    @classmethod
+    def _from_validated(cls, year: int, month: int, day: int):
+        """Construct a date from fields that are already known to be valid.
+
+        This is the trusted counterpart of the constructor: no type or range
+        check is done, so the caller must guarantee that year is a non-zero
+        int, month is in 1..12 and day is within the month.
+        """
+        self = object.__new__(cls)
+        self._ordinal = _ymd2ord_unchecked(year, month, day)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._timestamp = None
+        return self
+
+    @classmethod
+    def _from_ordinal(cls, n: int):
+        "Same as fromordinal, for an ordinal that is already an int."
+        self = object.__new__(cls)
+        self._ordinal = n
+        self._year = None
+        self._timestamp = None
+        return self
 
     @classmethod
     def fromtimestamp(cls, timestamp: int):
         "Construct a date from a POSIX timestamp (like time.time())."
-        y, m, d, hh, mm, ss, weekday, jday, dst = _time.gmtime(timestamp)
-        if y <= 0:
-            y -= 1
-        return cls(y, m, d)
+        return cls._from_ordinal(_EPOCH_ORDINAL + int(timestamp // SECONDSPERDAY))
 
     @classmethod
     def today(cls):
@@ -238,76 +380,127 @@ class alldate:
         """Construct a date from a proleptic Gregorian ordinal.
 
         January 1 of year 1 is day 0.  Only the year, month and day are
-        non-zero in the result.
+        non-zero in the result.  The year, month and day are derived from
+        the ordinal on first access.
+        """
+        return cls._from_ordinal(_index(n))
+
+    @classmethod
+    def fromcolumns(cls, years, months, days, validate: bool = True) -> list:
+        """Construct a list of dates from parallel year, month and day columns.
+
+        With validate=False the fields are trusted as-is, which is meant for
+        data that has already been validated (e.g. loaded from a column that
+        this library produced).
+        """
+        make = cls._from_validated
+        if validate:
+            return [
+                make(*_check_date_fields(y, m, d))
+                for y, m, d in zip(years, months, days)
+            ]
+        return [make(y, m, d) for y, m, d in zip(years, months, days)]
+
+    @classmethod
+    def fromisoformat(cls, date_string: str):
+        """Construct a date from the output of alldate.isoformat.
+
+        This is '[-]YYYY-MM-DD', where the year has at least four digits.
         """
-        y, m, d = _ord2ymd(n)
-        return cls(y, m, d)
+        fields = _parse_isoformat(date_string)
+        if len(fields) != 3:
+            raise ValueError("Invalid isoformat string: %r" % date_string)
+        return cls(*fields)
+
+    def _getymd(self):
+        "Derive year, month and day from the ordinal on first access."
+        if self._year is None:
+            self._year, self._month, self._day = _ord2ymd(self._ordinal)
+        return self._year, self._month, self._day
 
     @property
     def year(self) -> int:
-        """year (1-9999)"""
-        return self._year
+        """year"""
+        return self._getymd()[0]
 
     @property
     def month(self) -> int:
         """month (1-12)"""
-        return self._month
+        return self._getymd()[1]
 
     @property
     def day(self) -> int:
         """day (1-31)"""
-        return self._day
+        return self._getymd()[2]
 
     @property
     def timestamp(self) -> float:
+        """POSIX timestamp of the beginning of the date, in UTC."""
+        if self._timestamp is None:
+            self._timestamp = float(
+                (self._ordinal - _EPOCH_ORDINAL) * SECONDSPERDAY
+            )
         return self._timestamp
+
+    def localtimestamp(self) -> float:
+        "POSIX timestamp of the beginning of the date, in local time."
+        return _local_timestamp(self.timestamp)
     
     def weekday(self) -> int:
         "Return day of the week, where Monday == 0 ... Sunday == 6."
-        return (self.toordinal() + 7) % 7
+        return self._ordinal % 7
 
     # Comparisons of date objects with other.
 
     def __eq__(self, other):
         if isinstance(other, alldate):
-            return self._cmp(other) == 0
+            return self._ordinal == other._ordinal
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, alldate):
-            return self._cmp(other) <= 0
+            return self._ordinal <= other._ordinal
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, alldate):
-            return self._cmp(other) < 0
+            return self._ordinal < other._ordinal
         return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, alldate):
-            return self._cmp(other) >= 0
+            return self._ordinal >= other._ordinal
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, alldate):
-            return self._cmp(other) > 0
+            return self._ordinal > other._ordinal
         return NotImplemented
 
-    def _cmp(self, other):
-        assert isinstance(other, alldate)
-        y, m, d = self._year, self._month, self._day
-        y2, m2, d2 = other._year, other._month, other._day
-        return _cmp((y, m, d), (y2, m2, d2))
-
     def __hash__(self):
         "Hash."
-        if self._hashcode == -1:
-            self._hashcode = hash(self._getstate())
-        return self._hashcode
+        return hash(self._ordinal)
+
+    def sort_key(self) -> int:
+        """Return an integer that orders dates the same way as comparisons.
+
+        This is the proleptic ordinal, e.g. sorted(dates, key=alldate.sort_key).
+        """
+        return self._ordinal
 
-    def _getstate(self):
-        yhi, ylo = divmod(self._year, 256)
-        return (bytes([yhi, ylo, self._month, self._day]),)
+    def __reduce__(self):
+        "Pickle the date as its ordinal."
+        if type(self) is alldate:
+            return _unpickle_date, (self._ordinal,)
+        return _unpickle_date, (self._ordinal, type(self))
+
+    def __copy__(self):
+        "Return self: dates are immutable."
+        return self
+
+    def __deepcopy__(self, memo):
+        "Return self: dates are immutable."
+        return self
 
     def toordinal(self):
         """Return proleptic Gregorian ordinal for the year, month and day.
@@ -315,13 +508,13 @@ class alldate:
         January 1 of year 1 is day 0.  Only the year, month and day values
         contribute to the result.
         """
-        return _ymd2ord(self._year, self._month, self._day)
+        return self._ordinal
 
     def __add__(self, other):
         "Add a date to a timedelta."
         if isinstance(other, timedelta):
-            o = self.toordinal() + other.days
-            return type(self).fromordinal(o)
+            o = self._ordinal + other.days
+            return type(self)._from_ordinal(o)
         return NotImplemented
 
     __radd__ = __add__
@@ -329,11 +522,9 @@ class alldate:
     def __sub__(self, other):
         """Subtract two dates, or a date and a timedelta."""
         if isinstance(other, timedelta):
-            return self + timedelta(-other.days)
+            return type(self)._from_ordinal(self._ordinal - other.days)
         if isinstance(other, alldate):
-            days1 = self.toordinal()
-            days2 = other.toordinal()
-            return timedelta(days1 - days2)
+            return timedelta(self._ordinal - other._ordinal)
         return NotImplemented
 
     def isoformat(self):
@@ -345,19 +536,23 @@ class alldate:
         - http://www.w3.org/TR/NOTE-datetime
         - http://www.cl.cam.ac.uk/~mgk25/iso-time.html
         """
-        formater = "%04d-%02d-%02d" if self._year > 0 else "%05d-%02d-%02d"
-        return formater % (self._year, self._month, self._day)
+        return _format_date(*self._getymd())
 
     __str__ = isoformat
 
-    def strftime(self, format):
-        date_string = date(abs(self.year), self.month, self.day).strftime(format)
-        if self.year < 0:
-            date_string += BCENDING
-        else:
-            date_string += ADENDING
+    def _strftime_fields(self):
+        year, month, day = self._getymd()
+        return (year, month, day, 0, 0, 0, 0, self._ordinal)
+
+    def strftime(self, format, era: bool = True):
+        """Format the date according to format.
 
-        return date_string
+        By default %Y is the absolute year and ' BC' or ' AD' is appended;
+        with era=False, %Y is the signed year and nothing is appended.
+        """
+        from alldatetime._strftime import _strftime
+
+        return _strftime(self._strftime_fields(), format, era)
 
 
 class alldateperiod:
@@ -408,45 +603,56 @@ class alldateperiod:
 
     def __hash__(self):
         if self._hashcode == -1:
-            t = self
-            self._hashcode = hash(t._getstate()[0])
+            self._hashcode = hash(
+                (self._start_date.toordinal(), self._end_date.toordinal())
+            )
         return self._hashcode
 
-    def _getstate(self):
-        yhi1, ylo1 = divmod(self.start_date.year, 256)
-        yhi2, ylo2 = divmod(self.end_date.year, 256)
-        return (
-            bytes(
-                [
-                    yhi1,
-                    ylo1,
-                    self.start_date.month,
-                    self.start_date.day,
-                    yhi2,
-                    ylo2,
-                    self.end_date.month,
-                    self.end_date.day,
-                ]
-            ),
-        )
+    def __reduce__(self):
+        "Pickle the period as its start and end ordinals."
+        args = (self._start_date.toordinal(), self._end_date.toordinal())
+        if type(self) is not alldateperiod:
+            args += (type(self),)
+        return _unpickle_period, args
 
+    def __copy__(self):
+        "Return self: periods are immutable."
+        return self
 
-def _format_time(hh, mm, ss, us, timespec="auto"):
-    specs = {
-        "hours": "{:02d}",
-        "minutes": "{:02d}:{:02d}",
-        "seconds": "{:02d}:{:02d}:{:02d}",
-        "milliseconds": "{:02d}:{:02d}:{:02d}.{:03d}",
-        "microseconds": "{:02d}:{:02d}:{:02d}.{:06d}",
-    }
+    def __deepcopy__(self, memo):
+        "Return self: periods are immutable."
+        return self
 
+
+def _time_key(hour, minute, second, microsecond):
+    "hour, minute, second, microsecond -> microseconds since midnight."
+    return (
+        (hour * SECONDSPERHOUR + minute * SECONDSPERMINUTE + second) * 1000000
+        + microsecond
+    )
+
+
+def _timedelta_to_us(delta):
+    return (delta.days * SECONDSPERDAY + delta.seconds) * 1000000 + delta.microseconds
+
+
+_TIMESPECS = {
+    "hours": "{:02d}",
+    "minutes": "{:02d}:{:02d}",
+    "seconds": "{:02d}:{:02d}:{:02d}",
+    "milliseconds": "{:02d}:{:02d}:{:02d}.{:03d}",
+    "microseconds": "{:02d}:{:02d}:{:02d}.{:06d}",
+}
+
+
+def _format_time(hh, mm, ss, us, timespec="auto"):
     if timespec == "auto":
         # Skip trailing microseconds when us==0.
         timespec = "microseconds" if us else "seconds"
     elif timespec == "milliseconds":
         us //= 1000
     try:
-        fmt = specs[timespec]
+        fmt = _TIMESPECS[timespec]
     except KeyError:
         raise ValueError("Unknown timespec value")
     else:
@@ -454,13 +660,24 @@ def _format_time(hh, mm, ss, us, timespec="auto"):
 
 
 class alltime:
-    __slots__ = "_hour", "_minute", "_second", "_microsecond", "_hashcode"
+    __slots__ = "_hour", "_minute", "_second", "_microsecond", "_key"
 
     def __init__(self, hour, minute, second, microsecond=0):
         self._hour, self._minute, self._second, self._microsecond = _check_time_fields(
             hour, minute, second, microsecond
         )
-        self._hashcode = -1
+        self._key = _time_key(self._hour, self._minute, self._second, self._microsecond)
+
+    @classmethod
+    def _from_validated(cls, hour, minute, second, microsecond=0):
+        "Construct a time from fields that are already known to be valid."
+        self = object.__new__(cls)
+        self._hour = hour
+        self._minute = minute
+        self._second = second
+        self._microsecond = microsecond
+        self._key = _time_key(hour, minute, second, microsecond)
+        return self
 
     @property
     def hour(self):
@@ -492,55 +709,55 @@ class alltime:
 
     def __eq__(self, other):
         if isinstance(other, alltime):
-            return self._cmp(other) == 0
+            return self._key == other._key
         else:
             return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, alltime):
-            return self._cmp(other) <= 0
+            return self._key <= other._key
         else:
             return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, alltime):
-            return self._cmp(other) < 0
+            return self._key < other._key
         else:
             return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, alltime):
-            return self._cmp(other) >= 0
+            return self._key >= other._key
         else:
             return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, alltime):
-            return self._cmp(other) > 0
+            return self._key > other._key
         else:
             return NotImplemented
 
-    def _cmp(self, other):
-        assert isinstance(other, alltime)
-
-        return _cmp(
-            (self._hour, self._minute, self._second, self._microsecond),
-            (other._hour, other._minute, other._second, other._microsecond),
-        )
-
     def __hash__(self):
         """Hash."""
-        if self._hashcode == -1:
-            t = self
-            self._hashcode = hash(t._getstate()[0])
-        return self._hashcode
+        return hash(self._key)
+
+    def sort_key(self) -> int:
+        "Return the number of microseconds since midnight."
+        return self._key
 
-    def _getstate(self, protocol=3):
-        us2, us3 = divmod(self._microsecond, 256)
-        us1, us2 = divmod(us2, 256)
-        h = self._hour
-        basestate = bytes([h, self._minute, self._second, us1, us2, us3])
-        return (basestate,)
+    def __reduce__(self):
+        "Pickle the time as its number of microseconds since midnight."
+        if type(self) is alltime:
+            return _unpickle_time, (self._key,)
+        return _unpickle_time, (self._key, type(self))
+
+    def __copy__(self):
+        "Return self: times are immutable."
+        return self
+
+    def __deepcopy__(self, memo):
+        "Return self: times are immutable."
+        return self
 
     def isoformat(self, timespec="auto"):
         """Return the time formatted according to ISO.
@@ -567,7 +784,12 @@ class alltime:
 
 
 class alldatetime:
-    __slots__ = ("_date", "_time", "_hashcode")
+    """
+    A date and time, stored as the number of microseconds since
+    01-Jan-0001 00:00:00.  The fields are derived on first access.
+    """
+
+    __slots__ = ("_us", "_fields")
 
     def __init__(
         self,
@@ -579,9 +801,35 @@ class alldatetime:
         second: int = 0,
         microsecond: int = 0,
     ):
-        self._date = alldate(year, month, day)
-        self._time = alltime(hour, minute, second, microsecond)
-        self._hashcode = -1
+        year, month, day = _check_date_fields(year, month, day)
+        hour, minute, second, microsecond = _check_time_fields(
+            hour, minute, second, microsecond
+        )
+        self._us = _ymd2ord_unchecked(year, month, day) * _US_PER_DAY + _time_key(
+            hour, minute, second, microsecond
+        )
+        self._fields = None
+
+    @classmethod
+    def _from_validated(
+        cls, year, month, day, hour=0, minute=0, second=0, microsecond=0
+    ):
+        """Construct a date time from fields that are already known to be valid.
+
+        See alldate._from_validated.
+        """
+        return cls._from_microseconds(
+            _ymd2ord_unchecked(year, month, day) * _US_PER_DAY
+            + _time_key(hour, minute, second, microsecond)
+        )
+
+    @classmethod
+    def _from_microseconds(cls, us: int):
+        "Construct a date time from an int count of microseconds since 0001-01-01."
+        self = object.__new__(cls)
+        self._us = us
+        self._fields = None
+        return self
 
     @classmethod
     def fromtimestamp(cls, timestamp: int):
@@ -593,124 +841,163 @@ class alldatetime:
         elif us < 0:
             timestamp -= 1
             us += 1000000
-        y, m, d, hh, mm, ss, weekday, jday, dst = _time.gmtime(timestamp)
-        if y <= 0:
-            y -= 1
-        return cls(y, m, d, hh, mm, ss, us)
+        return cls._from_microseconds(_EPOCH_US + int(timestamp) * 1000000 + us)
+
+    @classmethod
+    def fromisoformat(cls, date_string: str):
+        """Construct a date time from the output of alldatetime.isoformat.
+
+        This is '[-]YYYY-MM-DD[ HH[:MM[:SS[.ffffff]]]]', where the year has at
+        least four digits and the separator may also be 'T'.
+        """
+        return cls(*_parse_isoformat(date_string))
+
+    def _getfields(self):
+        "Derive the date and time fields from the microsecond count."
+        if self._fields is None:
+            days, us = divmod(self._us, _US_PER_DAY)
+            seconds, us = divmod(us, 1000000)
+            hh, seconds = divmod(seconds, SECONDSPERHOUR)
+            mm, ss = divmod(seconds, SECONDSPERMINUTE)
+            self._fields = _ord2ymd(days) + (hh, mm, ss, us)
+        return self._fields
 
     @property
     def year(self):
-        """year (1-9999)"""
-        return self._date.year
+        """year"""
+        return self._getfields()[0]
 
     @property
     def month(self):
         """month (1-12)"""
-        return self._date.month
+        return self._getfields()[1]
 
     @property
     def day(self):
         """day (1-31)"""
-        return self._date.day
+        return self._getfields()[2]
 
     @property
     def hour(self):
         """hour (0-23)"""
-        return self._time.hour
+        return self._getfields()[3]
 
     @property
     def minute(self):
         """minute (0-59)"""
-        return self._time.minute
+        return self._getfields()[4]
 
     @property
     def second(self):
         """second (0-59)"""
-        return self._time.second
+        return self._getfields()[5]
 
     @property
     def microsecond(self):
         """microsecond (0-999999)"""
-        return self._time.microsecond
+        return self._getfields()[6]
 
     @property
     def timestamp(self):
-        return self._date.timestamp + self._time.seconds_from_zero_hour()
+        """POSIX timestamp of the date time, in UTC."""
+        return (self._us - _EPOCH_US) / 1000000
+
+    def localtimestamp(self) -> float:
+        "POSIX timestamp of the date time, in local time."
+        return _local_timestamp(self.timestamp)
 
     def date(self) -> alldate:
         "Return the date part."
-        return alldate(self._date.year, self._date.month, self._date.day)
+        return alldate._from_ordinal(self._us // _US_PER_DAY)
 
     def time(self) -> alltime:
-        return alltime(
-            self._time.hour,
-            self._time.minute,
-            self._time.second,
-            self._time.microsecond,
-        )
-    
+        return alltime._from_validated(*self._getfields()[3:])
+
     def weekday(self) -> int:
         "Return day of the week, where Monday == 0 ... Sunday == 6."
-        return self._date.weekday()
+        return self._us // _US_PER_DAY % 7
 
     def __eq__(self, other):
         if isinstance(other, alldatetime):
-            return self._cmp(other) == 0
+            return self._us == other._us
         return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, alldatetime):
-            return self._cmp(other) <= 0
+            return self._us <= other._us
         return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, alldatetime):
-            return self._cmp(other) < 0
+            return self._us < other._us
         return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, alldatetime):
-            return self._cmp(other) >= 0
+            return self._us >= other._us
         return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, alldatetime):
-            return self._cmp(other) > 0
+            return self._us > other._us
         return NotImplemented
 
-    def _cmp(self, other):
-        assert isinstance(other, alldatetime)
-        date_cmp = self._date._cmp(other._date)
-        if date_cmp == 0:
-            return self._time._cmp(other._time)
-        return date_cmp
-
     def __hash__(self):
-        if self._hashcode == -1:
-            t = self
-            self._hashcode = hash(t._getstate()[0])
-        return self._hashcode
+        return hash(self._us)
 
-    def _getstate(self, protocol=3):
-        yhi, ylo = divmod(self._year, 256)
-        us2, us3 = divmod(self._microsecond, 256)
-        us1, us2 = divmod(us2, 256)
-        m = self._month
-        basestate = bytes(
-            [
-                yhi,
-                ylo,
-                m,
-                self._day,
-                self._hour,
-                self._minute,
-                self._second,
-                us1,
-                us2,
-                us3,
-            ]
-        )
-        return (basestate,)
+    def sort_key(self) -> int:
+        """Return an integer that orders date times the same way as comparisons.
+
+        This is the number of microseconds since 01-Jan-0001 00:00:00.
+        """
+        return self._us
+
+    def __reduce__(self):
+        "Pickle the date time as its number of microseconds since 0001-01-01."
+        if type(self) is alldatetime:
+            return _unpickle_datetime, (self._us,)
+        return _unpickle_datetime, (self._us, type(self))
+
+    def __copy__(self):
+        "Return self: date times are immutable."
+        return self
+
+    def __deepcopy__(self, memo):
+        "Return self: date times are immutable."
+        return self
+
+    def __add__(self, other):
+        "Add a date time to a timedelta."
+        if isinstance(other, timedelta):
+            return type(self)._from_microseconds(self._us + _timedelta_to_us(other))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtract two date times, or a date time and a timedelta."""
+        if isinstance(other, timedelta):
+            return type(self)._from_microseconds(self._us - _timedelta_to_us(other))
+        if isinstance(other, alldatetime):
+            return timedelta(microseconds=self._us - other._us)
+        return NotImplemented
+
+    def add_microseconds(self, microseconds: int):
+        """Return the date time shifted by an int number of microseconds.
+
+        Unlike adding a timedelta, the shift is not limited to 999999999 days.
+        """
+        return type(self)._from_microseconds(self._us + _index(microseconds))
+
+    def microseconds_since(self, other) -> int:
+        """Return self - other as an int number of microseconds.
+
+        Unlike subtracting date times, the result is not limited to
+        999999999 days.
+        """
+        if not isinstance(other, alldatetime):
+            raise TypeError("other should be of type alldatetime.")
+        return self._us - other._us
 
     def isoformat(self, timespec="auto"):
         """Return the time formatted according to ISO.
@@ -722,7 +1009,8 @@ class alldatetime:
         terms of the time to include. Valid options are 'auto', 'hours',
         'minutes', 'seconds', 'milliseconds' and 'microseconds'.
         """
-        s = self._date.isoformat() + " " + self._time.isoformat(timespec)
+        y, m, d, hh, mm, ss, us = self._getfields()
+        s = _format_date(y, m, d) + " " + _format_time(hh, mm, ss, us, timespec)
 
         return s
 
@@ -730,42 +1018,158 @@ class alldatetime:
 
     @classmethod
     def strptime(cls, date_string: str, format: str):
-        bc = False
-        if date_string.startswith("-"):
-            bc = True
-            date_string = date_string.lstrip("-")
-        if date_string.endswith(BCENDING):
-            bc = True
-            date_string = date_string.rstrip(BCENDING)
-        if date_string.endswith(ADENDING):
-            bc = False
-            date_string = date_string.rstrip(ADENDING)
-        date_string = date_string.strip()
-        parsed_date = datetime.strptime(date_string, format)
-        year = parsed_date.year if not bc else -parsed_date.year
-        return cls(
-            year,
-            parsed_date.month,
-            parsed_date.day,
-            parsed_date.hour,
-            parsed_date.minute,
-            parsed_date.second,
-            parsed_date.microsecond,
-        )
+        """Parse a string according to a format.
 
-    def strftime(self, format):
-        date_string = datetime(
-            abs(self.year),
-            self.month,
-            self.day,
-            self.hour,
-            self.minute,
-            self.second,
-            self.microsecond,
-        ).strftime(format)
-        if self.year < 0:
-            date_string += BCENDING
+        Years are not limited: %Y accepts any number of digits and a sign, and
+        a trailing ' BC' or ' AD' (or a leading '-') marks the era.  Each
+        format string is compiled once and cached.
+        """
+        from alldatetime._strptime import _strptime
+
+        return cls(*_strptime(date_string, format))
+
+    def _strftime_fields(self):
+        return self._getfields() + (self._us // _US_PER_DAY,)
+
+    def strftime(self, format, era: bool = True):
+        """Format the date time according to format.
+
+        See alldate.strftime.
+        """
+        from alldatetime._strftime import _strftime
+
+        return _strftime(self._strftime_fields(), format, era)
+
+
+# Trusted reconstructors for pickles: the state was valid when pickled, so
+# it is not validated again.
+
+
+def _unpickle_date(ordinal, cls=alldate):
+    return cls._from_ordinal(ordinal)
+
+
+def _unpickle_period(start, end, cls=alldateperiod):
+    self = object.__new__(cls)
+    self._start_date = alldate._from_ordinal(start)
+    self._end_date = alldate._from_ordinal(end)
+    self._hashcode = -1
+    return self
+
+
+def _unpickle_time(key, cls=alltime):
+    seconds, microsecond = divmod(key, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return cls._from_validated(hour, minute, second, microsecond)
+
+
+def _unpickle_datetime(us, cls=alldatetime):
+    return cls._from_microseconds(us)
+
+
+def parse_many(strings):
+    """Parse an iterable of ISO formatted strings.
+
+    Yields an alldate for every string holding a date only, and an
+    alldatetime for every string holding a date and a time.
+    """
+    parse = _parse_isoformat
+    for date_string in strings:
+        fields = parse(date_string)
+        if len(fields) == 3:
+            yield alldate(*fields)
         else:
-            date_string += ADENDING
+            yield alldatetime(*fields)
+
+
+def strptime_many(strings, format: str):
+    """Parse an iterable of strings that share the same format.
+
+    Yields an alldatetime for every string, see alldatetime.strptime.
+    """
+    from alldatetime._strptime import _strptime
+
+    for date_string in strings:
+        yield alldatetime(*_strptime(date_string, format))
 
-        return date_string
+
+def strftime_many(
+    values, format: str, stream=None, sep: str = "\n", era: bool = True
+):
+    """Format an iterable of alldate or alldatetime values with the same format.
+
+    Returns the formatted values joined with sep, or, if a text stream is
+    given, writes them to it in chunks and returns the number of values
+    written.  See alldate.strftime for era.
+    """
+    from alldatetime._strftime import _strftime
+
+    formatted = (
+        _strftime(value._strftime_fields(), format, era) for value in values
+    )
+    if stream is None:
+        return sep.join(formatted)
+    return _write_chunked(formatted, stream, sep)
+
+
+# Number of values formatted per write by the bulk writers.
+_CHUNKSIZE = 4096
+
+
+def _write_chunked(strings, stream, sep, chunksize=_CHUNKSIZE):
+    "Write strings to stream, joined with sep, chunksize at a time."
+    count = 0
+    chunk = list(_islice(strings, chunksize))
+    while chunk:
+        if count:
+            stream.write(sep)
+        stream.write(sep.join(chunk))
+        count += len(chunk)
+        chunk = list(_islice(strings, chunksize))
+    return count
+
+
+def write_isoformat(
+    values, stream, sep: str = "\n", timespec: str = "auto"
+) -> int:
+    """Write the ISO format of alldate, alltime or alldatetime values to a
+    text stream, joined with sep.
+
+    The values are formatted and written in chunks.  timespec applies to
+    alltime and alldatetime values, see alldatetime.isoformat.  Returns the
+    number of values written.
+    """
+
+    def isoformat(value):
+        if isinstance(value, alldate):
+            return _format_date(*value._getymd())
+        return value.isoformat(timespec)
+
+    return _write_chunked(map(isoformat, values), stream, sep)
+
+
+def write_isoformat_columns(
+    years, months, days, stream, sep: str = "\n", validate: bool = True
+) -> int:
+    """Write dates given as parallel year, month and day columns to a text
+    stream in ISO format, joined with sep.
+
+    Each chunk of dates is formatted with a single %-operation.  With
+    validate=False the fields are trusted as-is, see alldate.fromcolumns.
+    Returns the number of dates written.
+    """
+    rows = zip(years, months, days)
+    if validate:
+        rows = (_check_date_fields(y, m, d) for y, m, d in rows)
+    formats = _DATE_FORMATS
+    count = 0
+    chunk = list(_islice(rows, _CHUNKSIZE))
+    while chunk:
+        template = sep.join([formats[row[0] > 0] for row in chunk])
+        if count:
+            stream.write(sep)
+        stream.write(template % tuple(_chain.from_iterable(chunk)))
+        count += len(chunk)
+        chunk = list(_islice(rows, _CHUNKSIZE))
+    return count
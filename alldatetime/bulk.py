@@ -0,0 +1,179 @@
+"""Bulk conversions over large iterables, optionally spread across processes.
+
+Every function takes a workers argument.  With workers=None (the default)
+or 1, the conversion runs in the calling process.  With more workers, the
+input is split into chunks of chunksize values which are converted by a
+ProcessPoolExecutor, and the results are returned in input order.
+
+Workers send back integer keys (ordinals or microsecond counts) packed in
+arrays, which pickle as raw bytes, and the objects are only built in the
+calling process.  Pass ints=True to get the keys themselves, as an
+array('q') (or a list for keys that do not fit in 64 bits), and skip
+building the objects altogether.
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice as _islice
+from operator import index as _index
+
+from alldatetime.alldatetime import alldate, alldatetime, strptime_many
+
+__all__ = ("format_many", "fromordinals", "fromtimestamps", "parse")
+
+_CHUNKSIZE = 65536
+
+
+def _chunks(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(_islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_chunks(kernel, iterable, workers, chunksize):
+    "Yield kernel(chunk) for the chunks of iterable, in order."
+    chunks = _chunks(iterable, chunksize)
+    if workers is None or workers <= 1:
+        for chunk in chunks:
+            yield kernel(chunk)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        # Keep a bounded number of chunks in flight, so that the input is
+        # not read ahead of the workers all at once.
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(kernel, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _compact(keys):
+    "list of int -> array('q'), or the list itself if a key does not fit."
+    try:
+        return array("q", keys)
+    except OverflowError:
+        return keys
+
+
+def _collect_keys(results):
+    keys = array("q")
+    for result in results:
+        if isinstance(keys, array) and not isinstance(result, array):
+            keys = keys.tolist()
+        keys.extend(result)
+    return keys
+
+
+def _collect(results, build, ints):
+    if ints:
+        return _collect_keys(results)
+    values = []
+    for result in results:
+        values.extend(map(build, result))
+    return values
+
+
+def _timestamps_kernel(timestamps):
+    return _compact([alldatetime.fromtimestamp(t).sort_key() for t in timestamps])
+
+
+def _ordinals_kernel(ordinals):
+    return _compact([_index(n) for n in ordinals])
+
+
+def _isoformat_kernel(kind, strings):
+    return _compact([kind.fromisoformat(s).sort_key() for s in strings])
+
+
+def _strptime_kernel(format, kind, strings):
+    values = strptime_many(strings, format)
+    if kind is alldate:
+        return _compact([value.date().sort_key() for value in values])
+    return _compact([value.sort_key() for value in values])
+
+
+def _format_kernel(format, era, values):
+    if format is None:
+        return [value.isoformat() for value in values]
+    return [value.strftime(format, era) for value in values]
+
+
+def fromtimestamps(
+    timestamps, workers: int = None, chunksize: int = _CHUNKSIZE, ints: bool = False
+):
+    """Convert POSIX timestamps to alldatetime values (see
+    alldatetime.fromtimestamp).
+
+    With ints=True, return their microseconds since 0001-01-01 instead.
+    """
+    results = _map_chunks(_timestamps_kernel, timestamps, workers, chunksize)
+    return _collect(results, alldatetime._from_microseconds, ints)
+
+
+def fromordinals(
+    ordinals, workers: int = None, chunksize: int = _CHUNKSIZE, ints: bool = False
+):
+    """Convert proleptic Gregorian ordinals to alldate values (see
+    alldate.fromordinal).
+
+    With ints=True, return the checked ordinals instead.
+    """
+    results = _map_chunks(_ordinals_kernel, ordinals, workers, chunksize)
+    return _collect(results, alldate._from_ordinal, ints)
+
+
+def parse(
+    strings,
+    format: str = None,
+    workers: int = None,
+    chunksize: int = _CHUNKSIZE,
+    ints: bool = False,
+    kind=alldatetime,
+):
+    """Parse strings to alldatetime values, or to alldate values with
+    kind=alldate.
+
+    Without format, the strings are in ISO format (see
+    alldatetime.fromisoformat and alldate.fromisoformat); otherwise they are
+    parsed according to format (see alldatetime.strptime), and alldate keeps
+    the date part.  With ints=True, return their keys instead: microseconds
+    since 0001-01-01 for alldatetime, and ordinals for alldate.
+    """
+    if kind not in (alldate, alldatetime):
+        raise ValueError("kind should be alldate or alldatetime.")
+    if format is None:
+        kernel = partial(_isoformat_kernel, kind)
+    else:
+        kernel = partial(_strptime_kernel, format, kind)
+    results = _map_chunks(kernel, strings, workers, chunksize)
+    if kind is alldate:
+        return _collect(results, alldate._from_ordinal, ints)
+    return _collect(results, alldatetime._from_microseconds, ints)
+
+
+def format_many(
+    values,
+    format: str = None,
+    era: bool = True,
+    workers: int = None,
+    chunksize: int = _CHUNKSIZE,
+) -> list:
+    """Format alldate or alldatetime values to a list of strings.
+
+    Without format, the values are in ISO format (see alldatetime.isoformat);
+    otherwise they are formatted according to format and era (see
+    alldatetime.strftime).
+    """
+    kernel = partial(_format_kernel, format, era)
+    results = _map_chunks(kernel, values, workers, chunksize)
+    strings = []
+    for result in results:
+        strings.extend(result)
+    return strings
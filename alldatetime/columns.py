@@ -0,0 +1,166 @@
+"""Sorted date columns stored on disk and read through a memory map.
+
+A column file is a sequence of alldate or alldatetime records in the
+layout of alldatetime.records, sorted in ascending order: little-endian
+int64 ordinals for alldate, and (int64 ordinal, int64 microseconds of the
+day) pairs for alldatetime.  Opening a column maps the file without reading
+it, so that processes share the page cache, and range queries bisect the
+mapped records.
+"""
+
+import mmap
+import sys
+from array import array
+from itertools import islice as _islice
+
+from alldatetime.alldatetime import _US_PER_DAY, alldate, alldatetime
+from alldatetime.records import pack_many, record_size
+
+__all__ = ("alldatecolumn", "write_column")
+
+_CHUNKSIZE = 65536
+
+
+def _check_cls(cls):
+    if cls is not alldate and cls is not alldatetime:
+        raise ValueError("cls should be alldate or alldatetime.")
+
+
+def _key(value, cls):
+    "value -> the int its records sort by."
+    if not isinstance(value, cls):
+        raise ValueError("value should be of type %s." % cls.__name__)
+    if cls is alldate:
+        return value.toordinal()
+    return value._us
+
+
+def write_column(values, path, cls=alldate) -> int:
+    """Write values, an iterable of cls sorted in ascending order, to a column
+    file at path.
+
+    cls is alldate or alldatetime.  Return the number of values written.
+    Raise ValueError if values are not sorted; the file is then incomplete.
+    """
+    _check_cls(cls)
+    count = 0
+    last = None
+    values = iter(values)
+    with open(path, "wb") as stream:
+        while True:
+            chunk = list(_islice(values, _CHUNKSIZE))
+            if not chunk:
+                break
+            for value in chunk:
+                key = _key(value, cls)
+                if last is not None and key < last:
+                    raise ValueError("values should be sorted in ascending order.")
+                last = key
+            stream.write(pack_many(chunk, cls))
+            count += len(chunk)
+    return count
+
+
+class alldatecolumn:
+    """
+    A read-only, memory-mapped column of sorted alldate or alldatetime values.
+
+    Values are only materialized when indexed; range queries bisect the
+    mapped records and return row ranges or zero-copy memoryview slices.
+    Views returned by the column must be released before it is closed.
+    """
+
+    __slots__ = "_cls", "_mmap", "_view", "_len"
+
+    def __init__(self, path, cls=alldate):
+        _check_cls(cls)
+        self._cls = cls
+        size = record_size(cls)
+        with open(path, "rb") as stream:
+            length = stream.seek(0, 2)
+            if length % size:
+                raise ValueError(
+                    "file length %d is not a multiple of the record size %d"
+                    % (length, size)
+                )
+            # mmap cannot map an empty file.
+            self._mmap = (
+                mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                if length
+                else None
+            )
+        if self._mmap is None:
+            self._view = memoryview(array("q"))
+        elif sys.byteorder == "little":
+            self._view = memoryview(self._mmap).cast("q")
+        else:
+            # Records are little-endian: big-endian machines need a copy.
+            ints = array("q", self._mmap)
+            ints.byteswap()
+            self._view = memoryview(ints)
+        self._len = length // size
+
+    def close(self):
+        "Release the memory map.  Views from the column must be released first."
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def view(self) -> memoryview:
+        """The int64 memoryview of the records: ordinals for alldate, and
+        ordinal, microsecond pairs for alldatetime."""
+        return self._view
+
+    def _key_at(self, i):
+        if self._cls is alldate:
+            return self._view[i]
+        return self._view[2 * i] * _US_PER_DAY + self._view[2 * i + 1]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("column index out of range")
+        if self._cls is alldate:
+            return alldate._from_ordinal(self._view[i])
+        return alldatetime._from_microseconds(self._key_at(i))
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield self[i]
+
+    def bisect_left(self, value) -> int:
+        "Return the first row whose value is not less than value."
+        key = _key(value, self._cls)
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def rows(self, start, end) -> range:
+        "Return the rows whose value is in [start, end)."
+        lo = self.bisect_left(start)
+        return range(lo, max(lo, self.bisect_left(end)))
+
+    def between(self, start, end) -> memoryview:
+        """Return the records whose value is in [start, end), as a zero-copy
+        slice of view."""
+        rows = self.rows(start, end)
+        width = 1 if self._cls is alldate else 2
+        return self._view[rows.start * width : rows.stop * width]
@@ -1,7 +1,10 @@
 from datetime import timedelta
 from enum import Enum
+from heapq import heappop as _heappop
+from heapq import heappush as _heappush
 from operator import index as _index
 
+from alldatetime.alldateperiods import _IntervalTree
 from alldatetime.alldatetime import (
     _check_month,
     _check_year,
@@ -21,11 +24,37 @@ class PrecisionUnit(Enum):
 
 
 class Precision:
-    def __init__(self, num: int, unit: PrecisionUnit):
-        if num < 0:
+    """
+    How far a fuzzy date may extend from its anchor, e.g. 2 days.
+
+    Precisions are immutable, and the common ones are interned: constructing
+    the same (num, unit) pair twice usually returns the same instance when
+    num is an int.
+    """
+
+    __slots__ = "_num", "_unit", "_days"
+
+    def __new__(cls, num: int, unit: PrecisionUnit):
+        try:
+            negative = num < 0
+        except TypeError:
+            raise ValueError("num should be a number.") from None
+        if negative:
             raise ValueError("num should not be negative.")
+        if not isinstance(unit, PrecisionUnit):
+            raise ValueError("unit should be of type PrecisionUnit.")
+        # Only int nums are interned, so that Precision(2.0, unit).num stays
+        # a float rather than being the num of an interned Precision(2, unit).
+        interned = cls is Precision and type(num) is int
+        if interned and (num, unit) in _PRECISIONS:
+            return _PRECISIONS[num, unit]
+        self = object.__new__(cls)
         self._num = num
         self._unit = unit
+        self._days = _precision_days(num, unit)
+        if interned and len(_PRECISIONS) < _MAX_PRECISIONS:
+            _PRECISIONS[num, unit] = self
+        return self
 
     @property
     def num(self):
@@ -35,8 +64,63 @@ class Precision:
     def unit(self):
         return self._unit
 
+    def __eq__(self, other):
+        if isinstance(other, Precision):
+            return self._num == other._num and self._unit is other._unit
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self._num, self._unit))
+
+    def __reduce__(self):
+        "Pickle the precision as (num, unit), so that it is interned again."
+        return type(self), (self._num, self._unit)
+
+    def __copy__(self):
+        "Return self: precisions are immutable."
+        return self
+
+    def __deepcopy__(self, memo):
+        "Return self: precisions are immutable."
+        return self
+
+
+def _precision_days(num, unit):
+    "Number of whole days a precision extends over."
+    if unit is PrecisionUnit.Year:
+        return int(num * 365)
+    if unit is PrecisionUnit.Month:
+        return int(num * 30.5)
+    return int(num)
+
+
+# Interned Precision instances, by (num, unit).
+_PRECISIONS = {}
+_MAX_PRECISIONS = 4096
+
+# (forward, backward) precisions inferred from the most precise field given.
+_YEAR_PRECISIONS = Precision(0, PrecisionUnit.Year), Precision(1, PrecisionUnit.Year)
+_MONTH_PRECISIONS = (
+    Precision(0, PrecisionUnit.Month),
+    Precision(1, PrecisionUnit.Month),
+)
+_DAY_PRECISIONS = Precision(0, PrecisionUnit.Day), Precision(1, PrecisionUnit.Day)
+
 
 class fuzzydate:
+    __slots__ = (
+        "_year",
+        "_month",
+        "_day",
+        "_precision",
+        "_forward_precision",
+        "_backward_precision",
+        "_anchor",
+        "_start",
+        "_end",
+        "_period",
+    )
+
     def __init__(
         self,
         year: int = None,
@@ -46,17 +130,30 @@ class fuzzydate:
         forward_precision: Precision = None,
         backward_precision: Precision = None,
     ):
-        (
-            self._year,
-            self._month,
-            self._day,
-            self._precision,
-            self._forward_precision,
-            self._backward_precision,
-        ) = self._check_parameters(
-            year, month, day, precision, forward_precision, backward_precision
+        self._set_fields(
+            *self._check_parameters(
+                year, month, day, precision, forward_precision, backward_precision
+            )
+        )
+
+    def _set_fields(
+        self, year, month, day, precision, forward_precision, backward_precision
+    ):
+        "Set the fields, which are already known to be valid."
+        self._year = year
+        self._month = month
+        self._day = day
+        self._precision = precision
+        self._forward_precision = forward_precision
+        self._backward_precision = backward_precision
+        self._anchor = alldate._from_validated(
+            self._year, self._month or 1, self._day or 1
         )
-        self._anchor = alldate(self._year, self._month or 1, self._day or 1)
+        # The resolved interval, as [start, end) ordinals.
+        anchor = self._anchor.toordinal()
+        self._start = anchor - self._forward_precision._days
+        self._end = anchor + self._backward_precision._days
+        self._period = None
 
     def _check_parameters(
         self,
@@ -69,13 +166,13 @@ class fuzzydate:
     ):
         if year is None:
             raise ValueError("year should not be None.")
-        _check_year(year)
-        inferred_forward_precision = Precision(0, PrecisionUnit.Year)
-        inferred_backward_precision = Precision(1, PrecisionUnit.Year)
+        year = _check_year(year)
+        inferred_forward_precision, inferred_backward_precision = _YEAR_PRECISIONS
         if month is not None:
-            _check_month(month)
-            inferred_forward_precision = Precision(0, PrecisionUnit.Month)
-            inferred_backward_precision = Precision(1, PrecisionUnit.Month)
+            month = _check_month(month)
+            inferred_forward_precision, inferred_backward_precision = (
+                _MONTH_PRECISIONS
+            )
         if day is not None:
             if month is None:
                 raise ValueError("month should not be None if day is not None.")
@@ -83,8 +180,7 @@ class fuzzydate:
             dim = _days_in_month(year, month)
             if not 1 <= day <= dim:
                 raise ValueError(f"day must be in 1..{dim}")
-            inferred_forward_precision = Precision(0, PrecisionUnit.Day)
-            inferred_backward_precision = Precision(1, PrecisionUnit.Day)
+            inferred_forward_precision, inferred_backward_precision = _DAY_PRECISIONS
         if forward_precision is None:
             forward_precision = precision or inferred_forward_precision
         if backward_precision is None:
@@ -99,6 +195,26 @@ class fuzzydate:
             backward_precision,
         )
 
+    def __reduce__(self):
+        "Pickle the fuzzy date as its fields."
+        return _unpickle_fuzzydate, (
+            type(self),
+            self._year,
+            self._month,
+            self._day,
+            self._precision,
+            self._forward_precision,
+            self._backward_precision,
+        )
+
+    def __copy__(self):
+        "Return self: fuzzy dates are immutable."
+        return self
+
+    def __deepcopy__(self, memo):
+        "Return self: fuzzy dates are immutable."
+        return self
+
     @property
     def year(self):
         return self._year
@@ -124,30 +240,35 @@ class fuzzydate:
         return self._backward_precision
 
     def to_alldateperiod(self) -> alldateperiod:
-        forward_timedelta = self._precision_to_timedelta(self.forward_precision)
-        backward_timedelta = self._precision_to_timedelta(self.backward_precision)
-        return alldateperiod(
-            self.anchor - forward_timedelta, self.anchor + backward_timedelta
-        )
+        if self._period is None:
+            self._period = alldateperiod(
+                alldate._from_ordinal(self._start), alldate._from_ordinal(self._end)
+            )
+        return self._period
 
     def _precision_to_timedelta(self, precision: Precision):
-        if precision.unit == PrecisionUnit.Year:
-            return timedelta(days=precision.num * 365)
-        if precision.unit == PrecisionUnit.Month:
-            return timedelta(days=int(precision.num * 30.5))
-        if precision.unit == PrecisionUnit.Day:
-            return timedelta(days=precision.num)
-
-    def to_alldateperiod_timestamps(self) -> tuple[float, float]:
+        return timedelta(days=precision._days)
+
+    def to_alldateperiod_timestamps(self, local: bool = False) -> tuple[float, float]:
         period = self.to_alldateperiod()
+        if local:
+            return (
+                period.start_date.localtimestamp(),
+                period.end_date.localtimestamp(),
+            )
         return (period.start_date.timestamp, period.end_date.timestamp)
 
     def overlap_with(self, other) -> bool:
         if not isinstance(other, fuzzydate):
             return False
-        self_period = self.to_alldateperiod()
-        other_period = other.to_alldateperiod()
-        return self_period.overlap_with(other_period)
+        return not (self._end <= other._start or self._start >= other._end)
+
+
+def _unpickle_fuzzydate(cls, *fields):
+    "Trusted reconstructor for pickles: the fields are not validated again."
+    self = object.__new__(cls)
+    self._set_fields(*fields)
+    return self
 
 
 class fuzzydateperiod:
@@ -175,11 +296,150 @@ class fuzzydateperiod:
     def cover(self, date: fuzzydate):
         if date is None:
             raise ValueError("date should not be None.")
-        start_period = self._start_date.to_alldateperiod()
-        end_period = self._end_date.to_alldateperiod()
-        date_period = date.to_alldateperiod()
-        start_date = start_period.start_date
-        end_date = end_period.end_date
         return not (
-            start_date >= date_period.end_date or end_date <= date_period.start_date
+            self._start_date._start >= date._end or self._end_date._end <= date._start
+        )
+
+
+def _query_ordinals(query):
+    "query -> the [start, end) ordinals of the dates it may fall on."
+    if isinstance(query, fuzzydate):
+        return query._start, query._end
+    if isinstance(query, fuzzydateperiod):
+        return query._start_date._start, query._end_date._end
+    if isinstance(query, alldateperiod):
+        return query.start_date.toordinal(), query.end_date.toordinal()
+    if isinstance(query, alldate):
+        n = query.toordinal()
+        return n, n + 1
+    raise ValueError(
+        "query should be of type fuzzydate, fuzzydateperiod, alldate or "
+        "alldateperiod."
+    )
+
+
+class fuzzydateindex:
+    """
+    An index over fuzzydate values, keyed by the range each of them resolves
+    to (see fuzzydate.to_alldateperiod).
+
+    The ranges are kept in an augmented interval tree.  Building the index
+    from n fuzzy dates takes O(n log n); inserting or removing one takes
+    O(log n), and overlap queries returning k fuzzy dates take O(log n + k).
+    within queries take O(log n + m) instead, where m is the number of fuzzy
+    dates starting in the range of the query, whether or not they end in it.
+
+    Queries may be a fuzzydate, a fuzzydateperiod (from the start of its
+    start date to the end of its end date), an alldateperiod or an alldate.
+    """
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, dates=()):
+        self._tree = _IntervalTree(
+            (date._start, date._end, date) for date in map(_check_fuzzydate, dates)
+        )
+
+    def __len__(self):
+        return len(self._tree)
+
+    def __iter__(self):
+        "Iterate over the fuzzy dates, ordered by the start then end of their range."
+        for _, _, date in self._tree:
+            yield date
+
+    def insert(self, date: fuzzydate):
+        date = _check_fuzzydate(date)
+        self._tree.insert(date._start, date._end, date)
+
+    def remove(self, date: fuzzydate):
+        """Remove the fuzzy date from the index.
+
+        Raise ValueError if it is not in the index.
+        """
+        date = _check_fuzzydate(date)
+        try:
+            self._tree.remove(date._start, date._end, date)
+        except KeyError:
+            raise ValueError("date is not in the index.") from None
+
+    def overlapping(self, query) -> list:
+        "Return the fuzzy dates whose range overlaps with the range of query."
+        return self._tree.overlapping(*_query_ordinals(query))
+
+    def covering(self, query) -> list:
+        "Return the fuzzy dates whose range contains the range of query."
+        return self._tree.containing(*_query_ordinals(query))
+
+    def within(self, query) -> list:
+        "Return the fuzzy dates whose range lies within the range of query."
+        return self._tree.within(*_query_ordinals(query))
+
+
+def _check_fuzzydate(date):
+    if not isinstance(date, fuzzydate):
+        raise ValueError("date should be of type fuzzydate.")
+    return date
+
+
+def _fuzzy_ordinals(value):
+    "fuzzydate or fuzzydateperiod -> [start, end) ordinals of its range."
+    if isinstance(value, fuzzydate):
+        return value._start, value._end
+    if isinstance(value, fuzzydateperiod):
+        return value._start_date._start, value._end_date._end
+    raise ValueError("value should be of type fuzzydate or fuzzydateperiod.")
+
+
+def overlap_join(left, right, min_overlap_days: int = 0, indices: bool = False):
+    """Yield the (left value, right value) pairs whose ranges overlap.
+
+    left and right are iterables of fuzzydate or fuzzydateperiod values, and
+    two values overlap as in fuzzydate.overlap_with.  With min_overlap_days,
+    only the pairs whose ranges share at least that many days are yielded.
+    With indices=True, the positions of the values in left and right are
+    yielded instead of the values.
+
+    Both sides are sorted by the start of their range and swept once, so
+    that the join takes O((n + m) log(n + m) + k) for k pairs.  Pairs are
+    yielded in the order the later-starting value of each pair is reached.
+    """
+    left = list(left)
+    right = list(right)
+    lefts = sorted(_fuzzy_ordinals(value) + (i,) for i, value in enumerate(left))
+    rights = sorted(_fuzzy_ordinals(value) + (i,) for i, value in enumerate(right))
+    # A value starting at start pairs with the swept values ending at or
+    # after start + days; as starts only grow, the others never pair again.
+    days = max(min_overlap_days, 1)
+    # Heaps of the (end, start, index) of the swept values still active.
+    left_active = []
+    right_active = []
+    i = j = 0
+    while i < len(lefts) or j < len(rights):
+        from_left = j == len(rights) or (
+            i < len(lefts) and lefts[i][0] <= rights[j][0]
         )
+        if from_left:
+            start, end, index = lefts[i]
+            i += 1
+            active, others = left_active, right_active
+        else:
+            start, end, index = rights[j]
+            j += 1
+            active, others = right_active, left_active
+        while others and others[0][0] < start + days:
+            _heappop(others)
+        if end - start < days:
+            continue
+        # Every remaining value starts at or before start and ends at or
+        # after start + days, and so shares at least days days with this one.
+        for _, _, other_index in others:
+            if from_left:
+                pair = index, other_index
+            else:
+                pair = other_index, index
+            if indices:
+                yield pair
+            else:
+                yield left[pair[0]], right[pair[1]]
+        _heappush(active, (end, start, index))
@@ -0,0 +1,176 @@
+"""Fixed-width binary records for dates, date times, periods and fuzzy dates.
+
+Every value is packed into a record of a fixed size, all integers being
+little-endian:
+
+    alldate          8 bytes   int64 ordinal
+    alldatetime     16 bytes   int64 ordinal, int64 microseconds of the day
+    alldateperiod   16 bytes   int64 start ordinal, int64 end ordinal
+    fuzzydate       20 bytes   int64 year, uint8 month, uint8 day,
+                               uint8 forward unit, uint8 backward unit,
+                               uint32 forward num, uint32 backward num
+
+Ordinals are the proleptic Gregorian ordinals of alldate.toordinal (0 is
+January 1, 1 AD).  A fuzzy date without month or day stores 0 for it, and
+precision units are stored as 0 for years, 1 for months and 2 for days.
+Precision nums are stored as is, so only integer precisions fit in a
+fuzzydate record: Precision(2.5, PrecisionUnit.Day) does not.
+"""
+
+import sys
+from array import array
+from itertools import chain as _chain
+from struct import Struct
+from struct import error as _StructError
+
+from alldatetime.alldatearray import alldatearray
+from alldatetime.alldatetime import _US_PER_DAY, alldate, alldateperiod, alldatetime
+from alldatetime.fuzzydatetime import Precision, PrecisionUnit, fuzzydate
+
+__all__ = ("pack_many", "record_size", "unpack_many")
+
+_FUZZY = Struct("<qBBBBII")
+_UNITS = (PrecisionUnit.Year, PrecisionUnit.Month, PrecisionUnit.Day)
+_UNIT_CODES = {unit: code for code, unit in enumerate(_UNITS)}
+
+_RECORD_SIZES = {
+    alldate: 8,
+    alldatetime: 16,
+    alldateperiod: 16,
+    fuzzydate: _FUZZY.size,
+}
+
+
+def record_size(cls) -> int:
+    "Return the size in bytes of the records of cls."
+    try:
+        return _RECORD_SIZES[cls]
+    except KeyError:
+        raise ValueError(
+            "cls should be alldate, alldatetime, alldateperiod or fuzzydate."
+        ) from None
+
+
+def _check_values(values, cls):
+    for value in values:
+        if not isinstance(value, cls):
+            raise ValueError("value should be of type %s." % cls.__name__)
+        yield value
+
+
+def _pack_int64(ints):
+    # array('q') raises OverflowError for values that do not fit.
+    packed = array("q", ints)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_int64(data):
+    ints = array("q")
+    ints.frombytes(data)
+    if sys.byteorder == "big":
+        ints.byteswap()
+    return ints
+
+
+def _precision_num(precision):
+    num = precision.num
+    if num != int(num):
+        raise ValueError(
+            "only integer precisions fit in fuzzydate records, not %r." % (num,)
+        )
+    return int(num)
+
+
+def _pack_fuzzy(date):
+    forward, backward = date.forward_precision, date.backward_precision
+    return _FUZZY.pack(
+        date.year,
+        date.month or 0,
+        date.day or 0,
+        _UNIT_CODES[forward.unit],
+        _UNIT_CODES[backward.unit],
+        _precision_num(forward),
+        _precision_num(backward),
+    )
+
+
+def _unpack_fuzzy(fields):
+    year, month, day, forward_unit, backward_unit, forward, backward = fields
+    if forward_unit >= len(_UNITS) or backward_unit >= len(_UNITS):
+        raise ValueError("invalid precision unit in fuzzydate record.")
+    return fuzzydate(
+        year,
+        month or None,
+        day or None,
+        forward_precision=Precision(forward, _UNITS[forward_unit]),
+        backward_precision=Precision(backward, _UNITS[backward_unit]),
+    )
+
+
+def pack_many(values, cls) -> bytes:
+    """Pack values of type cls into consecutive records.
+
+    cls is alldate, alldatetime, alldateperiod or fuzzydate.  An alldatearray
+    may be passed for alldate values; its ordinals are packed directly.
+    Raise OverflowError if a value does not fit in its record, and
+    ValueError for a fuzzydate with a fractional precision.
+    """
+    record_size(cls)
+    if cls is alldate:
+        if isinstance(values, alldatearray):
+            return _pack_int64(values.ordinals)
+        return _pack_int64(
+            value.toordinal() for value in _check_values(values, alldate)
+        )
+    if cls is alldatetime:
+        return _pack_int64(
+            _chain.from_iterable(
+                divmod(value._us, _US_PER_DAY)
+                for value in _check_values(values, alldatetime)
+            )
+        )
+    if cls is alldateperiod:
+        return _pack_int64(
+            _chain.from_iterable(
+                (value.start_date.toordinal(), value.end_date.toordinal())
+                for value in _check_values(values, alldateperiod)
+            )
+        )
+    try:
+        return b"".join(map(_pack_fuzzy, _check_values(values, fuzzydate)))
+    except _StructError as e:
+        raise OverflowError(str(e)) from None
+
+
+def unpack_many(data, cls) -> list:
+    """Unpack the consecutive records of type cls in data, a bytes-like object.
+
+    Return a list of cls instances.  Raise ValueError if the length of data
+    is not a multiple of the record size, or if a record is invalid.
+    """
+    size = record_size(cls)
+    data = memoryview(data).cast("B")
+    if len(data) % size:
+        raise ValueError(
+            "data length %d is not a multiple of the record size %d"
+            % (len(data), size)
+        )
+    if cls is fuzzydate:
+        return [_unpack_fuzzy(fields) for fields in _FUZZY.iter_unpack(data)]
+    ints = _unpack_int64(data)
+    if cls is alldate:
+        return [alldate._from_ordinal(n) for n in ints]
+    pairs = zip(ints[::2], ints[1::2])
+    if cls is alldatetime:
+        values = []
+        for ordinal, us in pairs:
+            if not 0 <= us < _US_PER_DAY:
+                raise ValueError("microseconds of the day out of range.", us)
+            values.append(alldatetime._from_microseconds(ordinal * _US_PER_DAY + us))
+        return values
+    return [
+        alldateperiod(alldate._from_ordinal(start), alldate._from_ordinal(end))
+        for start, end in pairs
+    ]
@@ -0,0 +1,192 @@
+"""Asynchronous parsing of date columns streamed from large text files.
+
+aparse_dates reads a stream in chunks, cuts it into lines, and parses the
+lines in batches on an executor, so that the event loop only splits text
+and never parses dates itself.  At most max_pending batches are in flight
+at a time: reading pauses until the oldest batch is parsed, which bounds
+memory whatever the size of the stream.
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+import re as _re
+from functools import partial
+
+from alldatetime.alldatetime import alldate, alldatetime, strptime_many
+from alldatetime.fuzzydatetime import fuzzydate
+
+__all__ = ("aparse_dates",)
+
+_CHUNKSIZE = 1 << 20
+_BATCHSIZE = 8192
+
+_FUZZY_RE = _re.compile(r"\s*([+-]?\d+)(?:-(\d{1,2})(?:-(\d{1,2}))?)?\s*\Z")
+
+
+def _parse_fuzzy(string):
+    "'[-]YYYY[-MM[-DD]]' -> fuzzydate."
+    found = _FUZZY_RE.match(string)
+    if found is None:
+        raise ValueError("Invalid fuzzy date string: %r" % string)
+    year, month, day = found.groups()
+    return fuzzydate(
+        int(year),
+        int(month) if month is not None else None,
+        int(day) if day is not None else None,
+    )
+
+
+def _extract(lines, layout, column):
+    "lines -> the strings of column, None for empty values."
+    if layout == "ndjson":
+        strings = []
+        for line in lines:
+            value = json.loads(line).get(column) if line.strip() else None
+            strings.append(value if value is None else str(value))
+    elif column is None:
+        strings = lines
+    else:
+        strings = [row[column] if row else None for row in csv.reader(lines)]
+    return [string if string and not string.isspace() else None for string in strings]
+
+
+def _parse(strings, kind, format):
+    if kind is fuzzydate:
+        return [_parse_fuzzy(string) for string in strings]
+    if format is None:
+        return [kind.fromisoformat(string.strip()) for string in strings]
+    values = strptime_many(strings, format)
+    if kind is alldate:
+        return [value.date() for value in values]
+    return list(values)
+
+
+def _parse_batch(lines, layout, column, kind, format):
+    "Parse a batch of lines; this runs on the executor."
+    strings = _extract(lines, layout, column)
+    present = [string for string in strings if string is not None]
+    if len(present) == len(strings):
+        return _parse(strings, kind, format)
+    values = iter(_parse(present, kind, format))
+    return [None if string is None else next(values) for string in strings]
+
+
+async def _read_lines(stream, encoding, chunk_size):
+    "Yield the lines of stream, without line endings."
+    if hasattr(stream, "read"):
+
+        async def chunks():
+            while True:
+                chunk = await stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+        source = chunks()
+    else:
+        source = stream
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ""
+    async for chunk in source:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line[:-1] if line.endswith("\r") else line
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail[:-1] if tail.endswith("\r") else tail
+
+
+async def _csv_records(lines):
+    """Join the lines of CSV records holding quoted newlines, so that every
+    yielded string is one record.  A record is complete when its number of
+    double quotes is even."""
+    pending = []
+    quotes = 0
+    async for line in lines:
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield "\n".join(pending)
+            pending = []
+            quotes = 0
+    if pending:
+        yield "\n".join(pending)
+
+
+async def aparse_dates(
+    stream,
+    column=None,
+    format: str = None,
+    kind=alldate,
+    layout: str = "csv",
+    executor=None,
+    batch_size: int = _BATCHSIZE,
+    max_pending: int = 2,
+    encoding: str = "utf-8",
+    chunk_size: int = _CHUNKSIZE,
+):
+    """Parse the dates of a column of a text stream, and yield them in
+    batches, as lists in stream order.
+
+    stream is an object with an async read(n) method returning bytes or str
+    (e.g. an asyncio.StreamReader), or an async iterable of bytes or str
+    chunks.  Every line holds one record:
+
+    - with layout='csv', column is the index of a field, or the name of a
+      field given in a header line, and quoted fields may hold newlines;
+      with column=None, the whole line is the value.
+    - with layout='ndjson', every line is a JSON object and column is a key.
+
+    kind is alldate, alldatetime or fuzzydate.  Values are in ISO format
+    (for fuzzydate, '[-]YYYY[-MM[-DD]]'), or else parsed according to format
+    (see alldatetime.strptime).  Empty or missing values are yielded as None,
+    and invalid values raise ValueError.
+
+    Batches are parsed with loop.run_in_executor(executor, ...): the default
+    executor keeps the event loop responsive, and a ProcessPoolExecutor also
+    parses batches in parallel.  At most max_pending batches are in flight.
+    """
+    if kind not in (alldate, alldatetime, fuzzydate):
+        raise ValueError("kind should be alldate, alldatetime or fuzzydate.")
+    if kind is fuzzydate and format is not None:
+        raise ValueError("format is not supported for fuzzydate.")
+    if layout not in ("csv", "ndjson"):
+        raise ValueError("layout should be 'csv' or 'ndjson'.")
+    if layout == "ndjson" and not isinstance(column, str):
+        raise ValueError("column should be a key for layout 'ndjson'.")
+
+    loop = asyncio.get_running_loop()
+    lines = _read_lines(stream, encoding, chunk_size)
+    if layout == "csv" and column is not None:
+        # Quoted fields may span lines: batches are made of whole records.
+        lines = _csv_records(lines)
+    if layout == "csv" and isinstance(column, str):
+        async for header in lines:
+            try:
+                column = next(csv.reader([header])).index(column)
+            except ValueError:
+                raise ValueError("column %r is not in the header." % column) from None
+            break
+    parse = partial(
+        _parse_batch, layout=layout, column=column, kind=kind, format=format
+    )
+
+    pending = []
+    batch = []
+    async for line in lines:
+        batch.append(line)
+        if len(batch) < batch_size:
+            continue
+        pending.append(loop.run_in_executor(executor, parse, batch))
+        batch = []
+        if len(pending) >= max_pending:
+            yield await pending.pop(0)
+    if batch:
+        pending.append(loop.run_in_executor(executor, parse, batch))
+    for future in pending:
+        yield await future
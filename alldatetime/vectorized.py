@@ -0,0 +1,148 @@
+"""
+NumPy-backed batch versions of the calendar conversions in
+alldatetime.alldatetime.
+
+NumPy is an optional dependency.  The functions in this module raise
+ImportError when it is not installed; the bulk APIs of the package (such as
+alldatearray.fromcolumns) check `available` and fall back to the scalar
+conversions instead.
+"""
+
+from alldatetime.alldatetime import (
+    _DAYS_BEFORE_MONTH,
+    _DAYS_IN_MONTH,
+    _DI4Y,
+    _DI100Y,
+    _DI400Y,
+)
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
+__all__ = (
+    "available",
+    "frombuffer",
+    "is_leap",
+    "ymd_to_ordinal",
+    "ordinal_to_ymd",
+)
+
+available = _np is not None
+
+# Years whose magnitude exceeds this are reported as invalid by
+# ymd_to_ordinal, as their ordinals could overflow int64.
+MAX_YEAR = 10**16
+
+if available:
+    _DIM = _np.array(_DAYS_IN_MONTH, dtype=_np.int64)
+    _DBM = _np.array(_DAYS_BEFORE_MONTH, dtype=_np.int64)
+
+
+def _require_numpy():
+    if not available:
+        raise ImportError("numpy is required for alldatetime.vectorized.")
+
+
+def frombuffer(buffer):
+    "Zero-copy int64 array over a buffer of int64 values, e.g. an array('q')."
+    _require_numpy()
+    return _np.frombuffer(buffer, dtype=_np.int64)
+
+
+def _asint64(values, name):
+    values = _np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise TypeError("%s should be integers." % name)
+    return values.astype(_np.int64, copy=False)
+
+
+def _astronomical(years):
+    "years (no year 0, -1 is 1 BC) -> astronomical years (0 is 1 BC)."
+    return _np.where(years < 0, years + 1, years)
+
+
+def _is_leap_astronomical(years):
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def is_leap(years):
+    "years -> bool array, True for leap years."
+    _require_numpy()
+    return _is_leap_astronomical(_astronomical(_asint64(years, "years")))
+
+
+def ymd_to_ordinal(years, months, days):
+    """years, months, days -> (ordinals, valid), considering 01-Jan-0001 as day 0.
+
+    All three arguments are integer array-likes that broadcast together.
+    Instead of raising, invalid dates are flagged False in the returned
+    bool mask `valid`; their ordinals are unspecified.
+    """
+    _require_numpy()
+    years = _asint64(years, "years")
+    months = _asint64(months, "months")
+    days = _asint64(days, "days")
+
+    valid = (
+        (years != 0)
+        & (_np.abs(years) <= MAX_YEAR)
+        & (months >= 1)
+        & (months <= 12)
+        & (days >= 1)
+    )
+    years = _np.where(valid, years, 1)
+    months = _np.where(valid, months, 1)
+
+    y = _astronomical(years)
+    leap = _is_leap_astronomical(y)
+    feb_leap = (months == 2) & leap
+    valid &= days <= _DIM[months] + feb_leap
+
+    y -= 1
+    ordinals = (
+        y * 365
+        + y // 4
+        - y // 100
+        + y // 400
+        + _DBM[months]
+        + ((months > 2) & leap)
+        + days
+        - 1
+    )
+    return ordinals, valid
+
+
+def ordinal_to_ymd(ordinals):
+    """ordinals -> (years, months, days), considering 01-Jan-0001 as day 0.
+
+    This applies the same 400/100/4-year cycle decomposition as _ord2ymd to
+    a whole int64 array.
+    """
+    _require_numpy()
+    n = _asint64(ordinals, "ordinals")
+
+    n400, n = _np.divmod(n, _DI400Y)
+    n100, n = _np.divmod(n, _DI100Y)
+    n4, n = _np.divmod(n, _DI4Y)
+    n1, n = _np.divmod(n, 365)
+
+    y = n400 * 400 + 1 + n100 * 100 + n4 * 4 + n1
+    # n1 == 4 or n100 == 4 means December 31 at the end of a 4- or 400-year
+    # cycle.
+    last_day = (n1 == 4) | (n100 == 4)
+    y -= last_day
+    leap = _is_leap_astronomical(y)
+
+    months = (n + 50) >> 5
+    preceding = _DBM[months] + ((months > 2) & leap)
+    too_large = preceding > n
+    months -= too_large
+    preceding -= too_large * (_DIM[months] + ((months == 2) & leap))
+    days = n - preceding + 1
+
+    months = _np.where(last_day, 12, months)
+    days = _np.where(last_day, 31, days)
+    years = _np.where(y <= 0, y - 1, y)
+    return years, months, days
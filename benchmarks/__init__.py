@@ -0,0 +1,126 @@
+"""Micro-benchmarks of the public operations of alldatetime.
+
+Every case times one operation for dates in three year ranges: BC, modern
+and beyond 9999.  Results are in nanoseconds per operation, and are compared
+against a JSON baseline to detect regressions.  Run with:
+
+    python -m benchmarks [--save] [--baseline PATH] [--threshold 0.25]
+
+Timings depend on the machine and the Python version: baselines are only
+comparable with runs on the machine that produced them.
+"""
+
+import json
+import platform
+import timeit
+from datetime import timedelta
+
+from alldatetime.alldatetime import alldate, alldateperiod, alldatetime
+from alldatetime.fuzzydatetime import fuzzydate, fuzzydateperiod
+
+YEARS = {"bc": -5000, "modern": 2023, "far": 123456}
+
+_DAY = timedelta(days=1)
+_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _cases(year):
+    "year -> {operation name: callable doing it once}."
+    date = alldate(year, 3, 15)
+    other = alldate(year, 3, 16)
+    ordinal = date.toordinal()
+    value = alldatetime(year, 3, 15, 12, 30, 5, 7)
+    iso = value.isoformat()
+    strptime_string = value.strftime(_FORMAT, era=False)
+    period = alldateperiod(date, alldate(year + 1, 1, 1))
+    other_period = alldateperiod(alldate(year, 6, 1), alldate(year + 2, 1, 1))
+    fuzzy = fuzzydate(year, 3)
+    fuzzy_period = fuzzydateperiod(fuzzydate(year), fuzzydate(year + 1))
+    return {
+        "alldate()": lambda: alldate(year, 3, 15),
+        "alldate.fromordinal": lambda: alldate.fromordinal(ordinal),
+        "alldate.toordinal": date.toordinal,
+        "alldate + timedelta": lambda: date + _DAY,
+        "alldate <": lambda: date < other,
+        "hash(alldate)": lambda: hash(date),
+        "alldate.isoformat": lambda: alldate.fromordinal(ordinal).isoformat(),
+        "alldate.strftime": lambda: date.strftime("%Y-%m-%d"),
+        "alldatetime()": lambda: alldatetime(year, 3, 15, 12, 30, 5, 7),
+        "alldatetime + timedelta": lambda: value + _DAY,
+        "alldatetime <": lambda: value < value,
+        "hash(alldatetime)": lambda: hash(value),
+        "alldatetime.isoformat": value.isoformat,
+        "alldatetime.fromisoformat": lambda: alldatetime.fromisoformat(iso),
+        "alldatetime.strftime": lambda: value.strftime(_FORMAT),
+        "alldatetime.strptime": lambda: alldatetime.strptime(
+            strptime_string, _FORMAT
+        ),
+        "alldateperiod.overlap_with": lambda: period.overlap_with(other_period),
+        "fuzzydate()": lambda: fuzzydate(year, 3),
+        "fuzzydate.to_alldateperiod": fuzzy.to_alldateperiod,
+        "fuzzydate.overlap_with": lambda: fuzzy.overlap_with(fuzzy),
+        "fuzzydateperiod.cover": lambda: fuzzy_period.cover(fuzzy),
+    }
+
+
+def _time(function, repeat):
+    "Best time of one call of function, in nanoseconds."
+    timer = timeit.Timer(function)
+    # autorange finds a number of calls taking at least 0.2 seconds; every
+    # repetition then takes about 0.05 seconds.
+    number, _ = timer.autorange()
+    number = max(1, number // 4)
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def run(filter: str = None, repeat: int = 5) -> dict:
+    """Run the benchmarks whose name contains filter.
+
+    Return {"<operation> [<year range>]": nanoseconds per operation}.
+    """
+    results = {}
+    for label, year in YEARS.items():
+        for name, function in _cases(year).items():
+            key = "%s [%s]" % (name, label)
+            if filter is None or filter in key:
+                results[key] = _time(function, repeat)
+    return results
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+    }
+
+
+def load(path) -> dict:
+    with open(path) as stream:
+        return json.load(stream)
+
+
+def save(results: dict, path):
+    with open(path, "w") as stream:
+        json.dump(
+            {
+                "environment": environment(),
+                "results": {name: round(ns, 1) for name, ns in results.items()},
+            },
+            stream,
+            indent=2,
+            sort_keys=True,
+        )
+        stream.write("\n")
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.25) -> list:
+    """Return the (name, baseline ns, ns) of the results more than threshold
+    (a fraction) slower than in baseline.  Names missing from baseline are
+    not compared."""
+    regressions = []
+    for name, ns in sorted(results.items()):
+        base = baseline["results"].get(name)
+        if base is not None and ns > base * (1 + threshold):
+            regressions.append((name, base, ns))
+    return regressions
@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+
+from benchmarks import compare, environment, load, run, save
+
+_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the public operations of alldatetime and compare "
+        "them against a baseline.",
+    )
+    parser.add_argument(
+        "--baseline", default=_BASELINE, help="baseline JSON file (%(default)s)"
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="write the results to the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fail if an operation is slower than the baseline by more than "
+        "this fraction (%(default)s)",
+    )
+    parser.add_argument("--filter", help="only run the operations containing this")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.repeat)
+    baseline = load(args.baseline) if os.path.exists(args.baseline) else None
+    width = max(map(len, results), default=0)
+    for name, ns in results.items():
+        line = "%-*s %10.1f ns" % (width, name, ns)
+        base = baseline and baseline["results"].get(name)
+        if base:
+            line += "  %+6.1f%%" % ((ns / base - 1) * 100)
+        print(line)
+
+    if args.save:
+        save(results, args.baseline)
+        print("Saved %d results to %s" % (len(results), args.baseline))
+        return 0
+    if baseline is None:
+        print("No baseline at %s; run with --save to create it." % args.baseline)
+        return 0
+    if baseline.get("environment") != environment():
+        print(
+            "Warning: the baseline was made on %s, not on %s."
+            % (baseline.get("environment"), environment())
+        )
+    regressions = compare(results, baseline, args.threshold)
+    for name, base, ns in regressions:
+        print(
+            "REGRESSION %s: %.1f ns -> %.1f ns (%+.1f%%)"
+            % (name, base, ns, (ns / base - 1) * 100)
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from alldatetime import vectorized
+from alldatetime.alldatearray import alldatearray
+from alldatetime.alldatetime import alldate
+
+
+class TestAllDateArray(unittest.TestCase):
+    def setUp(self):
+        self.dates = [
+            alldate(-4001, 2, 29),
+            alldate(-1, 12, 31),
+            alldate(1, 1, 1),
+            alldate(2023, 12, 15),
+            alldate(12345, 6, 7),
+        ]
+
+    def test_construction(self):
+        arr = alldatearray(self.dates)
+        self.assertEqual(len(arr), 5)
+        self.assertEqual(arr.ordinals.itemsize, 8)
+        self.assertEqual(list(arr), self.dates)
+        self.assertEqual(arr[1], alldate(-1, 12, 31))
+        self.assertEqual(arr[-1], alldate(12345, 6, 7))
+        self.assertEqual(list(arr[1:3]), self.dates[1:3])
+        self.assertEqual(
+            alldatearray.fromordinals([d.toordinal() for d in self.dates]), arr
+        )
+        self.assertEqual(
+            alldatearray.fromordinals(memoryview(arr.ordinals)).ordinals, arr.ordinals
+        )
+
+        years = [d.year for d in self.dates]
+        months = [d.month for d in self.dates]
+        days = [d.day for d in self.dates]
+        self.assertEqual(alldatearray.fromcolumns(years, months, days), arr)
+        self.assertEqual(
+            alldatearray.fromcolumns(years, months, days, validate=False), arr
+        )
+        with self.assertRaises(ValueError):
+            alldatearray.fromcolumns([2023], [2], [29])
+        with self.assertRaises(TypeError):
+            alldatearray([2023])
+
+    def test_comparisons(self):
+        arr = alldatearray(self.dates)
+        pivot = alldate(1, 1, 1)
+        self.assertEqual(arr.eq(pivot), [d == pivot for d in self.dates])
+        self.assertEqual(arr.ne(pivot), [d != pivot for d in self.dates])
+        self.assertEqual(arr.lt(pivot), [d < pivot for d in self.dates])
+        self.assertEqual(arr.le(pivot), [d <= pivot for d in self.dates])
+        self.assertEqual(arr.gt(pivot), [d > pivot for d in self.dates])
+        self.assertEqual(arr.ge(pivot), [d >= pivot for d in self.dates])
+
+        other = alldatearray(reversed(self.dates))
+        self.assertEqual(arr.lt(other), [True, True, False, False, False])
+        with self.assertRaises(ValueError):
+            arr.eq(arr[1:])
+
+    def test_arithmetic(self):
+        arr = alldatearray(self.dates)
+        delta = timedelta(days=400)
+        self.assertEqual(list(arr + delta), [d + delta for d in self.dates])
+        self.assertEqual(list(delta + arr), [d + delta for d in self.dates])
+        self.assertEqual(list(arr - delta), [d - delta for d in self.dates])
+        self.assertEqual(
+            list(arr - alldate(1, 1, 1)),
+            [(d - alldate(1, 1, 1)).days for d in self.dates],
+        )
+        self.assertEqual(list((arr + delta) - arr), [400] * 5)
+
+    def test_weekdays_and_isoformat(self):
+        arr = alldatearray(self.dates)
+        self.assertEqual(list(arr.weekdays()), [d.weekday() for d in self.dates])
+        self.assertEqual(arr.isoformat(), [d.isoformat() for d in self.dates])
+
+    def test_tocolumns(self):
+        arr = alldatearray(self.dates)
+        years, months, days = arr.tocolumns()
+        self.assertEqual(list(years), [d.year for d in self.dates])
+        self.assertEqual(list(months), [d.month for d in self.dates])
+        self.assertEqual(list(days), [d.day for d in self.dates])
+        self.assertEqual(alldatearray.fromcolumns(years, months, days), arr)
+
+    def test_without_numpy(self):
+        with mock.patch.object(vectorized, "available", False):
+            self.test_construction()
+            self.test_weekdays_and_isoformat()
+            self.test_tocolumns()
+            self.assertEqual(alldatearray().tocolumns(), ([], [], []))
@@ -0,0 +1,164 @@
+import random
+import unittest
+
+from alldatetime.alldateperiods import (
+    alldateperiodcoverage,
+    alldateperiodindex,
+    alldateperiodset,
+)
+from alldatetime.alldatetime import alldate, alldateperiod
+
+
+def _period(start, end):
+    return alldateperiod(alldate.fromordinal(start), alldate.fromordinal(end))
+
+
+class TestAllDatePeriodIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        self.periods = []
+        for _ in range(500):
+            start = rng.randint(-2000, 2000)
+            self.periods.append(_period(start, start + rng.choice([0, 1, 5, 50, 900])))
+        self.periods.append(self.periods[0])
+
+    def _sorted(self, periods):
+        return sorted(
+            periods, key=lambda p: (p.start_date.toordinal(), p.end_date.toordinal())
+        )
+
+    def test_queries(self):
+        index = alldateperiodindex(self.periods)
+        self.assertEqual(len(index), len(self.periods))
+        self.assertEqual(list(index), self._sorted(self.periods))
+        for start, end in [(-3000, -2500), (-10, 10), (0, 0), (5, 6), (1500, 3000)]:
+            query = _period(start, end)
+            self.assertEqual(
+                index.overlapping(query),
+                self._sorted(p for p in self.periods if p.overlap_with(query)),
+            )
+        for n in [-2500, -100, 0, 1, 777, 2899]:
+            date = alldate.fromordinal(n)
+            self.assertEqual(
+                index.covering(date),
+                self._sorted(p for p in self.periods if p.cover(date)),
+            )
+        with self.assertRaises(ValueError):
+            index.covering(None)
+        with self.assertRaises(ValueError):
+            index.overlapping(alldate(1, 1, 1))
+
+    def test_insert_remove(self):
+        index = alldateperiodindex()
+        periods = list(self.periods)
+        for period in periods:
+            index.insert(period)
+        random.Random(7).shuffle(periods)
+        removed, kept = periods[:300], periods[300:]
+        for period in removed:
+            index.remove(period)
+        self.assertEqual(len(index), len(kept))
+        self.assertEqual(list(index), self._sorted(kept))
+        query = _period(-500, 500)
+        self.assertEqual(
+            index.overlapping(query),
+            self._sorted(p for p in kept if p.overlap_with(query)),
+        )
+        with self.assertRaises(ValueError):
+            index.remove(_period(10**6, 10**6 + 1))
+
+
+def _days(periods):
+    days = set()
+    for period in periods:
+        start, end = period.start_date.toordinal(), period.end_date.toordinal()
+        days.update(range(start, end))
+    return days
+
+
+class TestAllDatePeriodSet(unittest.TestCase):
+    def _random_periods(self, rng, count):
+        periods = []
+        for _ in range(count):
+            start = rng.randint(-300, 300)
+            periods.append(_period(start, start + rng.randint(0, 40)))
+        return periods
+
+    def test_normalize(self):
+        periodset = alldateperiodset(
+            [
+                _period(5, 10),
+                _period(1, 3),
+                _period(3, 4),
+                _period(8, 12),
+                _period(20, 20),
+            ]
+        )
+        self.assertEqual(list(periodset), [_period(1, 4), _period(5, 12)])
+        self.assertEqual(len(periodset), 2)
+        self.assertEqual(periodset.total_days(), 10)
+        self.assertTrue(periodset.cover(alldate.fromordinal(11)))
+        self.assertFalse(periodset.cover(alldate.fromordinal(4)))
+        self.assertIn(alldate.fromordinal(1), periodset)
+        self.assertNotIn(alldate.fromordinal(12), periodset)
+        self.assertNotIn(None, periodset)
+        with self.assertRaises(ValueError):
+            periodset.cover(None)
+        self.assertEqual(list(alldateperiodset()), [])
+
+    def test_algebra(self):
+        rng = random.Random(3)
+        for _ in range(50):
+            a_periods = self._random_periods(rng, rng.randint(0, 15))
+            b_periods = self._random_periods(rng, rng.randint(0, 15))
+            a, b = alldateperiodset(a_periods), alldateperiodset(b_periods)
+            a_days, b_days = _days(a_periods), _days(b_periods)
+            self.assertEqual(_days(a), a_days)
+            self.assertEqual(a.total_days(), len(a_days))
+            self.assertEqual(_days(a | b), a_days | b_days)
+            self.assertEqual(_days(a & b), a_days & b_days)
+            self.assertEqual(_days(a - b), a_days - b_days)
+            self.assertEqual(a.union(b_periods), a | b)
+            bounds = _period(-100, 100)
+            self.assertEqual(_days(a.complement(bounds)), _days([bounds]) - a_days)
+            for result in (a | b, a & b, a - b, a.complement(bounds)):
+                self.assertEqual(alldateperiodset(result), result)
+
+
+class TestAllDatePeriodCoverage(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(15)
+        self.periods = []
+        for _ in range(300):
+            start = rng.randint(-500, 500)
+            self.periods.append(_period(start, start + rng.choice([0, 1, 7, 40, 300])))
+        self.coverage = alldateperiodcoverage(self.periods)
+
+    def test_counts(self):
+        dates = [alldate.fromordinal(n) for n in range(-600, 900, 7)]
+        expected = [sum(p.cover(date) for p in self.periods) for date in dates]
+        self.assertEqual(self.coverage.counts(dates), expected)
+        self.assertEqual(
+            self.coverage.counts(reversed(dates)), list(reversed(expected))
+        )
+        self.assertEqual([self.coverage.count(date) for date in dates], expected)
+        self.assertEqual(alldateperiodcoverage().counts(dates), [0] * len(dates))
+        with self.assertRaises(ValueError):
+            self.coverage.counts([0])
+
+    def test_step_function(self):
+        steps = self.coverage.step_function()
+        self.assertEqual(steps[-1][1], 0)
+        for (date, count), (next_date, next_count) in zip(steps, steps[1:]):
+            self.assertLess(date, next_date)
+            self.assertNotEqual(count, next_count)
+            self.assertEqual(self.coverage.count(date), count)
+        for n in range(-600, 900):
+            date = alldate.fromordinal(n)
+            active = [count for start, count in steps if start <= date]
+            self.assertEqual(active[-1] if active else 0, self.coverage.count(date))
+        self.assertEqual(
+            alldateperiodcoverage([_period(3, 3), _period(0, 5)]).step_function(),
+            [(alldate.fromordinal(0), 1), (alldate.fromordinal(5), 0)],
+        )
+
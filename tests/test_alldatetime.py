@@ -1,5 +1,11 @@
+import copy
+import math
+import os
+import pickle
+import time
 import unittest
-from datetime import timedelta
+from datetime import datetime, timedelta
+from io import StringIO
 
 from alldatetime.alldatetime import (
     _is_leap,
@@ -9,11 +15,20 @@ from alldatetime.alldatetime import (
     alldateperiod,
     alldatetime,
     alltime,
+    parse_many,
+    strftime_many,
+    strptime_many,
+    write_isoformat,
+    write_isoformat_columns,
 )
 
 connection = ""
 
 
+class _subdate(alldate):
+    __slots__ = ()
+
+
 class TestAllDateTime(unittest.TestCase):
     def test_all_date(self):
         timestamps = [
@@ -32,6 +47,51 @@ class TestAllDateTime(unittest.TestCase):
             self.assertEqual(date, (ad.year, ad.month, ad.day))
             self.assertEqual(int(timestamp), int(ad.timestamp))
 
+    def test_timestamp_beyond_time_t(self):
+        timestamps = [
+            ((100000, 1, 1), 3093527980800),
+            ((-100000, 1, 1), -3217830796800),
+        ]
+        for date, timestamp in timestamps:
+            self.assertEqual(alldate(*date).timestamp, timestamp)
+            self.assertEqual(alldatetime(*date).timestamp, timestamp)
+
+    def test_fromtimestamp_beyond_time_t(self):
+        self.assertEqual(alldate.fromtimestamp(3093527980800), alldate(100000, 1, 1))
+        self.assertEqual(
+            alldatetime.fromtimestamp(-3217830796800 + 3661.5),
+            alldatetime(-100000, 1, 1, 1, 1, 1, 500000),
+        )
+
+    def test_alldate_fromcolumns(self):
+        years, months, days = [-44, 2000, 12345], [3, 2, 1], [15, 29, 1]
+        for validate in (True, False):
+            dates = alldate.fromcolumns(years, months, days, validate=validate)
+            self.assertEqual(
+                dates, [alldate(-44, 3, 15), alldate(2000, 2, 29), alldate(12345, 1, 1)]
+            )
+        with self.assertRaises(ValueError):
+            alldate.fromcolumns([2001], [2], [29])
+        with self.assertRaises(ValueError):
+            alldate.fromcolumns([0], [1], [1])
+
+    def test_localtimestamp(self):
+        tz = os.environ.get("TZ")
+        os.environ["TZ"] = "XXX-8"
+        time.tzset()
+        try:
+            ad = alldate(2000, 1, 1)
+            self.assertEqual(ad.timestamp, 946684800)
+            self.assertEqual(ad.localtimestamp(), 946684800 - 8 * 3600)
+            adt = alldatetime(-5000, 1, 1, 12)
+            self.assertEqual(adt.localtimestamp(), adt.timestamp - 8 * 3600)
+        finally:
+            if tz is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = tz
+            time.tzset()
+
     def test_all_datetime(self):
         timestamps = [
             ((1970, 1, 1, 0, 0, 0, 0), 0),
@@ -218,6 +278,84 @@ class TestAllDateTime(unittest.TestCase):
             self.assertEqual(dt.strftime("%Y-%m-%d %H:%M:%S"), s1)
             self.assertEqual(dt.strftime("%Y/%m/%d %H:%M:%S"), s2)
 
+    def test_strftime_extended(self):
+        format = (
+            "%y %m %d %e %H %I %p %M %S %f %j %a %A %b %B %w %u %U %W %G %V %x %X "
+            "%z%Z%%"
+        )
+        for d in [
+            datetime(2000, 2, 29, 13, 5, 9, 1234),
+            datetime(2021, 1, 3, 0, 0, 0),
+            datetime(2023, 1, 1, 0, 0, 0),
+            datetime(2024, 12, 30, 8),
+            datetime(2023, 12, 31, 23, 59, 59, 999999),
+            datetime(1999, 7, 4, 12, 30),
+        ]:
+            adt = alldatetime(
+                d.year, d.month, d.day, d.hour, d.minute, d.second, d.microsecond
+            )
+            self.assertEqual(adt.strftime(format, era=False), d.strftime(format))
+            self.assertEqual(
+                adt.date().strftime(format, era=False),
+                d.replace(hour=0, minute=0, second=0, microsecond=0).strftime(format),
+            )
+
+        formats = [
+            (alldate(12345, 6, 7), "%Y-%m-%d", "12345-06-07 AD"),
+            (alldate(-12345, 6, 7), "%Y-%m-%d", "12345-06-07 BC"),
+            (alldate(-44, 3, 15), "%d %b %Y", "15 Mar 0044 BC"),
+            (alldate(-44, 3, 15), "%F", "0044-03-15 BC"),
+            (alldate(4898, 10, 20), "%G-%V-%u", "4898-43-1 AD"),
+            (alldate(12345, 12, 31), "%G-W%V-%u", "12346-W01-1 AD"),
+            (alldate(-5000, 12, 31), "%G-W%V-%u", "5000-W53-4 BC"),
+            (alldate(2000, 1, 1), "%z%Z", " AD"),
+        ]
+        for d, format, s in formats:
+            self.assertEqual(d.strftime(format), s)
+        self.assertEqual(
+            alldate(-44, 3, 15).strftime("%Y-%m-%d", era=False), "-0044-03-15"
+        )
+        self.assertEqual(
+            alldate(-1, 1, 1).strftime("%G-W%V-%u", era=False), "-0002-W52-6"
+        )
+        self.assertEqual(
+            alldatetime(12345, 1, 1, 10).strftime("%Y-%m-%dT%H", era=False),
+            "12345-01-01T10",
+        )
+
+        # Other directives are those of datetime.strftime, for years 1 to 9999.
+        d = datetime(2023, 3, 5, 14, 7)
+        adt = alldatetime(2023, 3, 5, 14, 7)
+        for format in ["%-d/%-m %k:%M", "%k", "%-d %B %Y %H"]:
+            self.assertEqual(adt.strftime(format, era=False), d.strftime(format))
+        self.assertEqual(alldate(-44, 3, 5).strftime("%-d %b %Y"), "5 Mar 0044 BC")
+        with self.assertRaises(ValueError):
+            alldate(12345, 1, 1).strftime("%-d")
+        with self.assertRaises(ValueError):
+            alldatetime(-12345, 1, 1).strftime("%Y %k")
+
+        values = [alldate(-44, 3, 15), alldatetime(12345, 1, 1, 10)]
+        self.assertEqual(
+            strftime_many(values, "%Y-%m-%d %H"),
+            "0044-03-15 00 BC\n12345-01-01 10 AD",
+        )
+        stream = StringIO()
+        count = strftime_many(
+            (alldate.fromordinal(n) for n in range(10000)),
+            "%Y%m%d",
+            stream=stream,
+            sep=",",
+            era=False,
+        )
+        self.assertEqual(count, 10000)
+        self.assertEqual(
+            stream.getvalue().split(","),
+            [
+                alldate.fromordinal(n).strftime("%Y%m%d", era=False)
+                for n in range(10000)
+            ],
+        )
+
     def test_strptime(self):
         datetime_formats = [
             (
@@ -252,6 +390,109 @@ class TestAllDateTime(unittest.TestCase):
         for s, dt in datetime_formats:
             self.assertEqual(alldatetime.strptime(s, "%Y"), dt)
 
+    def test_strptime_extended(self):
+        parsed = [
+            ("12345-06-07", "%Y-%m-%d", alldatetime(12345, 6, 7)),
+            ("-12345-06-07", "%Y-%m-%d", alldatetime(-12345, 6, 7)),
+            ("12345-06-07 BC", "%Y-%m-%d", alldatetime(-12345, 6, 7)),
+            ("  44 BC ", "%Y", alldatetime(-44, 1, 1)),
+            ("44 bc", "%Y", alldatetime(-44, 1, 1)),
+            ("-07/06/12345", "%d/%m/%Y", alldatetime(-12345, 6, 7)),
+            ("07/06/12345 AD", "%d/%m/%Y", alldatetime(12345, 6, 7)),
+            ("20000229", "%Y%m%d", alldatetime(2000, 2, 29)),
+            ("123450607", "%Y%m%d", alldatetime(12345, 6, 7)),
+            ("15 Mar 44 BC", "%d %b %Y", alldatetime(-44, 3, 15)),
+            ("Friday, 15 march 2024", "%A, %d %B %Y", alldatetime(2024, 3, 15)),
+            ("2000-060", "%Y-%j", alldatetime(2000, 2, 29)),
+            ("07:05:03 PM", "%I:%M:%S %p", alldatetime(1900, 1, 1, 19, 5, 3)),
+            ("12 am", "%I %p", alldatetime(1900, 1, 1, 0)),
+            (
+                "99-12-31 10:00:00.25",
+                "%y-%m-%d %H:%M:%S.%f",
+                alldatetime(1999, 12, 31, 10, 0, 0, 250000),
+            ),
+            ("10%", "%d%%", alldatetime(1900, 1, 10)),
+        ]
+        for s, format, dt in parsed:
+            self.assertEqual(alldatetime.strptime(s, format), dt)
+
+        invalid = [
+            ("2000-01-32", "%Y-%m-%d"),
+            ("2001-02-29", "%Y-%m-%d"),
+            ("2000-01-01 extra", "%Y-%m-%d"),
+            ("0-01-01", "%Y-%m-%d"),
+            ("2000", "%Y %Q"),
+            ("-2000-01-01 AD", "%Y-%m-%d"),
+            ("-07/06/12345 AD", "%d/%m/%Y"),
+            ("2000", "%Y%"),
+            ("2000 2000", "%Y %Y"),
+        ]
+        for s, format in invalid:
+            with self.assertRaises(ValueError):
+                alldatetime.strptime(s, format)
+
+        self.assertEqual(
+            list(strptime_many(["5000/01/08 BC", "12345/01/08"], "%Y/%m/%d")),
+            [alldatetime(-5000, 1, 8), alldatetime(12345, 1, 8)],
+        )
+
+    def test_strptime_datetime_directives(self):
+        # Formats accepted by datetime.strptime give the same naive values.
+        parsed = [
+            ("2023-03-15T10:00:00+0000", "%Y-%m-%dT%H:%M:%S%z"),
+            ("2023-03-15T10:00:00-05:30", "%Y-%m-%dT%H:%M:%S%z"),
+            ("2023-03-15T10:00:00Z", "%Y-%m-%dT%H:%M:%S%z"),
+            ("2023-03-15 10:00 UTC", "%Y-%m-%d %H:%M %Z"),
+            ("2023-03-15 3", "%Y-%m-%d %w"),
+            ("2023-03-15 3", "%Y-%m-%d %u"),
+            ("Wed Mar 15 10:00:00 2023", "%c"),
+            ("03/15/23 10:11:12", "%x %X"),
+            ("2023 11 3", "%Y %U %w"),
+            ("2023 0 0", "%Y %U %w"),
+            ("2023 11 Wednesday", "%Y %W %A"),
+            ("2023 0 1", "%Y %W %u"),
+            ("2024 53 2", "%Y %U %w"),
+            ("2020-W53-5", "%G-W%V-%u"),
+            ("2021-W01-Mon", "%G-W%V-%a"),
+        ]
+        for s, format in parsed:
+            d = datetime.strptime(s, format)
+            self.assertEqual(
+                alldatetime.strptime(s, format),
+                alldatetime(d.year, d.month, d.day, d.hour, d.minute, d.second),
+            )
+        self.assertEqual(
+            alldatetime.strptime("12345-W01-1", "%G-W%V-%u"), alldatetime(12345, 1, 1)
+        )
+
+        for s, format in [
+            ("2021-W53-1", "%G-W%V-%u"),
+            ("2021-W05", "%G-W%V"),
+            ("2021 5 1", "%Y %V %u"),
+            ("2023-03-05 BC", "%Y-%m-%d %Z"),
+        ]:
+            with self.assertRaises(ValueError):
+                alldatetime.strptime(s, format)
+        self.assertEqual(
+            alldatetime.strptime("2023-03-05 UTC BC", "%Y-%m-%d %Z"),
+            alldatetime(-2023, 3, 5),
+        )
+
+    def test_strptime_reads_strftime(self):
+        # %y (in %D and %x) only reads years 1969 to 2068 back.
+        for d in [
+            alldatetime(1970, 1, 1),
+            alldatetime(2000, 2, 29, 13, 5),
+            alldatetime(2068, 12, 31, 23, 59),
+        ]:
+            for format in ["%F %T", "%D %R", "%c", "%x %X", "%e %h %Y %R"]:
+                s = d.strftime(format, era=False)
+                self.assertEqual(alldatetime.strptime(s, format), d, (s, format))
+        for d in [alldatetime(-5000, 1, 8, 1, 2, 3), alldatetime(12345, 6, 7)]:
+            for format in ["%F %T", "%c", "%e %h %Y %H:%M:%S"]:
+                s = d.strftime(format)
+                self.assertEqual(alldatetime.strptime(s, format), d, (s, format))
+
     def test__ymd2ord(self):
         ymd2ords = [
             ((1, 1, 1), 0),
@@ -395,3 +636,241 @@ class TestAllDateTime(unittest.TestCase):
 
         for date, weekday in dates:
             self.assertEqual(date.weekday(), weekday)
+
+    def test_alldate_ordinal(self):
+        ordinals = [
+            ((1, 1, 1), 0),
+            ((-1, 12, 31), -1),
+            ((2023, 12, 14), 738867),
+            ((-4001, 2, 29), -1461277),
+            ((12345, 6, 7), 4508710),
+        ]
+        for ymd, ordinal in ordinals:
+            self.assertEqual(alldate(*ymd).toordinal(), ordinal)
+            date = alldate.fromordinal(ordinal)
+            self.assertEqual(date.toordinal(), ordinal)
+            self.assertEqual((date.year, date.month, date.day), ymd)
+            self.assertEqual(date, alldate(*ymd))
+
+        self.assertEqual(
+            alldate(12345, 6, 7) - alldate(-4001, 2, 29),
+            timedelta(days=4508710 + 1461277),
+        )
+
+    def test_sort_key_and_hash(self):
+        dates = [
+            alldate(12345, 1, 1),
+            alldate(-70000, 5, 5),
+            alldate(2023, 12, 15),
+            alldate(-1, 12, 31),
+            alldate(1, 1, 1),
+        ]
+        self.assertEqual(sorted(dates, key=alldate.sort_key), sorted(dates))
+        copies = [alldate(d.year, d.month, d.day) for d in dates]
+        self.assertEqual(len(set(dates + copies)), 5)
+        self.assertEqual(alldate(1, 1, 1).sort_key(), 0)
+
+        times = [alltime(23, 59, 59, 999999), alltime(0, 0, 0), alltime(12, 30, 1, 5)]
+        self.assertEqual(sorted(times, key=alltime.sort_key), sorted(times))
+        self.assertEqual(alltime(0, 0, 1, 5).sort_key(), 1000005)
+        self.assertEqual(hash(alltime(1, 2, 3)), hash(alltime(1, 2, 3)))
+
+        datetimes = [
+            alldatetime(12345, 1, 1, 10),
+            alldatetime(-70000, 5, 5, 23, 59, 59, 999999),
+            alldatetime(-70000, 5, 6),
+            alldatetime(1, 1, 1, 0, 0, 0, 1),
+            alldatetime(-1, 12, 31, 23, 59, 59, 999999),
+        ]
+        self.assertEqual(
+            sorted(datetimes, key=alldatetime.sort_key), sorted(datetimes)
+        )
+        self.assertEqual(alldatetime(1, 1, 1, 0, 0, 0, 1).sort_key(), 1)
+        self.assertEqual(alldatetime(-1, 12, 31, 23, 59, 59, 999999).sort_key(), -1)
+        self.assertIn(alldatetime(12345, 1, 1, 10), set(datetimes))
+        self.assertEqual(
+            hash(alldateperiod(alldate(-5, 1, 1), alldate(300, 1, 1))),
+            hash(alldateperiod(alldate(-5, 1, 1), alldate(300, 1, 1))),
+        )
+
+    def test_pickle_and_copy(self):
+        values = [
+            alldate(-70000, 5, 5),
+            alldate.fromordinal(10**12),
+            alltime(23, 59, 59, 999999),
+            alldatetime(-44, 3, 15, 12, 30, 5, 7),
+            alldateperiod(alldate(-5, 1, 1), alldate(300, 1, 1)),
+        ]
+        for value in values:
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                unpickled = pickle.loads(pickle.dumps(value, protocol))
+                self.assertIs(type(unpickled), type(value))
+                self.assertEqual(unpickled, value)
+                self.assertEqual(hash(unpickled), hash(value))
+            self.assertIs(copy.copy(value), value)
+            self.assertIs(copy.deepcopy(value), value)
+        self.assertEqual(
+            pickle.loads(pickle.dumps(alldate(-1, 12, 31))).isoformat(), "-0001-12-31"
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(alltime(1, 2, 3, 4))).second, 3)
+        self.assertIs(type(pickle.loads(pickle.dumps(_subdate(1, 2, 3)))), _subdate)
+        # A date is pickled as its ordinal, not as its cached fields.
+        self.assertLess(len(pickle.dumps(alldate(2023, 12, 15), 4)), 80)
+
+    def test_alldatetime_components(self):
+        datetimes = [
+            (-70000, 5, 5, 23, 59, 59, 0),
+            (-1, 12, 31, 0, 0, 0, 0),
+            (1, 1, 1, 0, 0, 0, 1),
+            (2023, 12, 15, 10, 20, 30, 400000),
+            (12345, 6, 7, 8, 9, 10, 11),
+        ]
+        for fields in datetimes:
+            adt = alldatetime(*fields)
+            self.assertEqual(adt.date(), alldate(*fields[:3]))
+            self.assertEqual(adt.time(), alltime(*fields[3:]))
+            self.assertEqual(adt.weekday(), alldate(*fields[:3]).weekday())
+
+            adt = alldatetime.fromtimestamp(math.floor(adt.timestamp))
+            self.assertEqual(
+                fields[:6],
+                (adt.year, adt.month, adt.day, adt.hour, adt.minute, adt.second),
+            )
+        self.assertEqual(
+            str(alldatetime(-44, 3, 15, 12, 0, 0, 5)), "-0044-03-15 12:00:00.000005"
+        )
+
+    def test_alldatetime_add_timedelta(self):
+        add_datetimes = [
+            (
+                alldatetime(-1, 12, 31, 23, 59, 59, 999999),
+                timedelta(microseconds=1),
+                alldatetime(1, 1, 1),
+            ),
+            (
+                alldatetime(-1201, 2, 28, 12),
+                timedelta(hours=12, microseconds=5),
+                alldatetime(-1201, 2, 29, 0, 0, 0, 5),
+            ),
+            (
+                alldatetime(2000, 2, 28, 23, 30),
+                timedelta(days=1, minutes=30),
+                alldatetime(2000, 3, 1),
+            ),
+            (
+                alldatetime(9999, 12, 31, 23, 59, 59, 999999),
+                timedelta(days=2, microseconds=1),
+                alldatetime(10000, 1, 3),
+            ),
+            (
+                alldatetime(2023, 12, 15, 1),
+                timedelta(hours=-2),
+                alldatetime(2023, 12, 14, 23),
+            ),
+        ]
+        for dt, delta, result in add_datetimes:
+            self.assertEqual(dt + delta, result)
+            self.assertEqual(delta + dt, result)
+            self.assertEqual(result - delta, dt)
+            self.assertEqual(result - dt, delta)
+            self.assertEqual(dt - result, -delta)
+
+        far = alldatetime(5000000, 1, 1)
+        near = alldatetime(1, 1, 1, 0, 0, 0, 1)
+        span = far.microseconds_since(near)
+        self.assertEqual(span, far.sort_key() - 1)
+        self.assertEqual(near.add_microseconds(span), far)
+        self.assertEqual(far.add_microseconds(-span), near)
+        with self.assertRaises(OverflowError):
+            far - near
+
+    def test_fromisoformat(self):
+        dates = [
+            alldate(-44, 3, 15),
+            alldate(-12345, 12, 31),
+            alldate(1, 1, 1),
+            alldate(2000, 2, 29),
+            alldate(12345, 1, 1),
+        ]
+        for date in dates:
+            self.assertEqual(alldate.fromisoformat(date.isoformat()), date)
+
+        datetimes = [
+            alldatetime(-44, 3, 15, 12),
+            alldatetime(-12345, 12, 31, 23, 59, 59, 999999),
+            alldatetime(2000, 2, 29, 1, 2, 3, 400000),
+            alldatetime(12345, 1, 1, 10, 0, 0, 500000),
+        ]
+        for dt in datetimes:
+            for timespec in ("auto", "microseconds"):
+                self.assertEqual(
+                    alldatetime.fromisoformat(dt.isoformat(timespec)), dt
+                )
+
+        parsed = [
+            ("12345-01-01 10:00:00.5", alldatetime(12345, 1, 1, 10, 0, 0, 500000)),
+            ("-0044-03-15T12:30", alldatetime(-44, 3, 15, 12, 30)),
+            ("+2000-01-01 07", alldatetime(2000, 1, 1, 7)),
+            ("2000-01-01", alldatetime(2000, 1, 1)),
+        ]
+        for s, dt in parsed:
+            self.assertEqual(alldatetime.fromisoformat(s), dt)
+
+        invalid = [
+            "",
+            "200-01-01",
+            "2000-1-01",
+            "2000-01-1",
+            "2000/01/01",
+            "2000-01-01 ",
+            "2000-01-01 1",
+            "2000-01-01 10:0",
+            "2000-01-01 10:00:00.",
+            "2000-01-01 10:00:00.1234567",
+            "2000-01-01 10:00:00+01:00",
+            "0000-01-01",
+            "2001-02-29",
+            "2000-01-01 24:00",
+        ]
+        for s in invalid:
+            with self.assertRaises(ValueError):
+                alldatetime.fromisoformat(s)
+        with self.assertRaises(ValueError):
+            alldate.fromisoformat("2000-01-01 10:00")
+
+        self.assertEqual(
+            list(parse_many(["-0044-03-15", "12345-01-01 10:00:00.5"])),
+            [alldate(-44, 3, 15), alldatetime(12345, 1, 1, 10, 0, 0, 500000)],
+        )
+
+    def test_write_isoformat(self):
+        values = [
+            alldate(-44, 3, 15),
+            alldatetime(12345, 1, 1, 10, 0, 0, 500000),
+            alltime(1, 2, 3),
+        ]
+        stream = StringIO()
+        self.assertEqual(write_isoformat(values, stream), 3)
+        self.assertEqual(
+            stream.getvalue(),
+            "-0044-03-15\n12345-01-01 10:00:00.500000\n01:02:03",
+        )
+        stream = StringIO()
+        write_isoformat(values[1:], stream, sep=",", timespec="milliseconds")
+        self.assertEqual(stream.getvalue(), "12345-01-01 10:00:00.500,01:02:03.000")
+
+        dates = [alldate.fromordinal(n) for n in range(-5000, 5000, 3)]
+        years = [d.year for d in dates]
+        months = [d.month for d in dates]
+        days = [d.day for d in dates]
+        for validate in (True, False):
+            stream = StringIO()
+            count = write_isoformat_columns(
+                years, months, days, stream, validate=validate
+            )
+            self.assertEqual(count, len(dates))
+            self.assertEqual(
+                stream.getvalue(), "\n".join(d.isoformat() for d in dates)
+            )
+        with self.assertRaises(ValueError):
+            write_isoformat_columns([2001], [2], [29], StringIO())
@@ -0,0 +1,76 @@
+import unittest
+from array import array
+
+from alldatetime import bulk
+from alldatetime.alldatetime import alldate, alldatetime
+
+
+class TestBulk(unittest.TestCase):
+    def test_fromtimestamps(self):
+        timestamps = [0, 1.5, -86400.25, 1e12, -1e12]
+        expected = [alldatetime.fromtimestamp(t) for t in timestamps]
+        self.assertEqual(bulk.fromtimestamps(timestamps), expected)
+        self.assertEqual(bulk.fromtimestamps(iter(timestamps), chunksize=2), expected)
+        keys = bulk.fromtimestamps(timestamps, ints=True)
+        self.assertIsInstance(keys, array)
+        self.assertEqual(list(keys), [value.sort_key() for value in expected])
+        # Keys beyond 64 bits fall back to a list.
+        values = bulk.fromtimestamps([0, 1e18, 1])
+        keys = bulk.fromtimestamps([0, 1e18, 1], chunksize=1, ints=True)
+        self.assertEqual(keys, [value.sort_key() for value in values])
+
+    def test_fromordinals(self):
+        ordinals = list(range(-1000, 1000, 7))
+        self.assertEqual(
+            bulk.fromordinals(ordinals, chunksize=10),
+            [alldate.fromordinal(n) for n in ordinals],
+        )
+        self.assertEqual(list(bulk.fromordinals(ordinals, ints=True)), ordinals)
+        with self.assertRaises(TypeError):
+            bulk.fromordinals([1.5])
+
+    def test_parse_and_format(self):
+        values = [
+            alldatetime(2023, 12, 15, 10, 30),
+            alldatetime(-44, 3, 15, 12),
+            alldatetime(123456, 1, 1, 0, 0, 0, 5),
+        ]
+        strings = bulk.format_many(values)
+        self.assertEqual(strings, [value.isoformat() for value in values])
+        self.assertEqual(bulk.parse(strings), values)
+        strings = bulk.format_many(values, "%Y-%m-%d %H:%M:%S.%f", era=False)
+        self.assertEqual(bulk.parse(strings, "%Y-%m-%d %H:%M:%S.%f"), values)
+        self.assertEqual(bulk.format_many([alldate(-1, 1, 1)], "%Y"), ["0001 BC"])
+        self.assertEqual(bulk.parse([]), [])
+        with self.assertRaises(ValueError):
+            bulk.parse(["not a date"])
+
+    def test_parse_dates(self):
+        dates = [alldate(2023, 12, 15), alldate(-44, 3, 15), alldate(123456, 1, 1)]
+        strings = bulk.format_many(dates)
+        self.assertEqual(bulk.parse(strings, kind=alldate), dates)
+        self.assertEqual(
+            list(bulk.parse(strings, kind=alldate, ints=True)),
+            [date.toordinal() for date in dates],
+        )
+        strings = bulk.format_many(dates, "%d/%m/%Y 12:00", era=False)
+        self.assertEqual(bulk.parse(strings, "%d/%m/%Y %H:%M", kind=alldate), dates)
+        with self.assertRaises(ValueError):
+            bulk.parse(["2023-12-15 10:30"], kind=alldate)
+        with self.assertRaises(ValueError):
+            bulk.parse(strings, kind=str)
+
+    def test_workers(self):
+        ordinals = list(range(-500, 500))
+        dates = [alldate.fromordinal(n) for n in ordinals]
+        self.assertEqual(bulk.fromordinals(ordinals, workers=2, chunksize=64), dates)
+        strings = bulk.format_many(dates, workers=2, chunksize=64)
+        self.assertEqual(strings, [date.isoformat() for date in dates])
+        self.assertEqual(
+            bulk.parse(strings, workers=2, chunksize=64, ints=True),
+            array("q", [n * 86400000000 for n in ordinals]),
+        )
+        self.assertEqual(
+            bulk.fromtimestamps([0, 1, 2], workers=2, chunksize=1),
+            [alldatetime(1970, 1, 1, 0, 0, s) for s in range(3)],
+        )
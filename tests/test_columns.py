@@ -0,0 +1,70 @@
+import os
+import random
+import tempfile
+import unittest
+
+from alldatetime.alldatetime import alldate, alldatetime
+from alldatetime.columns import alldatecolumn, write_column
+from alldatetime.records import pack_many
+
+
+class TestAllDateColumn(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "column.bin")
+
+    def test_alldate(self):
+        rng = random.Random(21)
+        ordinals = sorted(rng.randint(-100000, 100000) for _ in range(5000))
+        dates = [alldate.fromordinal(n) for n in ordinals]
+        self.assertEqual(write_column(iter(dates), self.path), len(dates))
+        with open(self.path, "rb") as stream:
+            self.assertEqual(stream.read(), pack_many(dates, alldate))
+        with alldatecolumn(self.path) as column:
+            self.assertEqual(len(column), len(dates))
+            self.assertEqual(column.view.tolist(), ordinals)
+            self.assertEqual(column[0], dates[0])
+            self.assertEqual(column[-1], dates[-1])
+            self.assertEqual(column[10:13], dates[10:13])
+            for start, end in [(-200000, -5000), (-10, 10), (7, 7), (50, -50)]:
+                rows = [i for i, n in enumerate(ordinals) if start <= n < end]
+                start, end = alldate.fromordinal(start), alldate.fromordinal(end)
+                self.assertEqual(list(column.rows(start, end)), rows)
+                view = column.between(start, end)
+                self.assertEqual(view.tolist(), [ordinals[i] for i in rows])
+                view.release()
+            with self.assertRaises(IndexError):
+                column[len(dates)]
+
+    def test_alldatetime(self):
+        rng = random.Random(22)
+        years = [-2, -1, 1, 2]
+        values = sorted(
+            alldatetime(rng.choice(years), 1, rng.randint(1, 3), rng.randint(0, 23))
+            for _ in range(300)
+        )
+        write_column(values, self.path, alldatetime)
+        with alldatecolumn(self.path, alldatetime) as column:
+            self.assertEqual(list(column), values)
+            start, end = alldatetime(-1, 1, 2, 12), alldatetime(2, 1, 1, 6)
+            rows = column.rows(start, end)
+            self.assertEqual(
+                column[rows.start : rows.stop],
+                [value for value in values if start <= value < end],
+            )
+            self.assertEqual(len(column.between(start, end)), 2 * len(rows))
+
+    def test_empty_and_errors(self):
+        write_column([], self.path)
+        with alldatecolumn(self.path) as column:
+            self.assertEqual(len(column), 0)
+            self.assertEqual(list(column.rows(alldate(1, 1, 1), alldate(2, 1, 1))), [])
+        with self.assertRaises(ValueError):
+            write_column([alldate(2, 1, 1), alldate(1, 1, 1)], self.path)
+        with self.assertRaises(ValueError):
+            write_column([alldate(1, 1, 1)], self.path, int)
+        with open(self.path, "wb") as stream:
+            stream.write(bytes(12))
+        with self.assertRaises(ValueError):
+            alldatecolumn(self.path)
@@ -1,7 +1,17 @@
+import copy
+import pickle
+import random
 import unittest
 
 from alldatetime.alldatetime import alldate, alldateperiod
-from alldatetime.fuzzydatetime import fuzzydate, Precision, PrecisionUnit, fuzzydateperiod
+from alldatetime.fuzzydatetime import (
+    Precision,
+    PrecisionUnit,
+    fuzzydate,
+    fuzzydateindex,
+    fuzzydateperiod,
+    overlap_join,
+)
 from datetime import timedelta
 
 
@@ -53,3 +63,183 @@ class TestFuzzyDate(unittest.TestCase):
         self.assertTrue(period.cover(fuzzydate(202, 3)))
         self.assertTrue(period.cover(fuzzydate(202, 1)))
         self.assertFalse(period.cover(fuzzydate(202, 6)))
+
+    def test_precision(self):
+        self.assertIs(Precision(2, PrecisionUnit.Day), Precision(2, PrecisionUnit.Day))
+        self.assertIs(
+            fuzzydate(202).forward_precision, fuzzydate(203).forward_precision
+        )
+        self.assertEqual(
+            Precision(2.5, PrecisionUnit.Day), Precision(2.5, PrecisionUnit.Day)
+        )
+        self.assertNotEqual(
+            Precision(2, PrecisionUnit.Day), Precision(2, PrecisionUnit.Month)
+        )
+        with self.assertRaises(AttributeError):
+            Precision(2, PrecisionUnit.Day).num = 3
+        with self.assertRaises(ValueError):
+            Precision(-1, PrecisionUnit.Day)
+        with self.assertRaises(ValueError):
+            Precision(1, "Day")
+        with self.assertRaises(ValueError):
+            Precision([2], PrecisionUnit.Day)
+        with self.assertRaises(ValueError):
+            Precision(-1.5, PrecisionUnit.Day)
+        self.assertIs(type(Precision(2.0, PrecisionUnit.Day).num), float)
+        self.assertEqual(
+            Precision(2.0, PrecisionUnit.Day), Precision(2, PrecisionUnit.Day)
+        )
+        with self.assertRaises(AttributeError):
+            fuzzydate(202).extra = 1
+
+    def test_pickle_and_copy(self):
+        fdate = fuzzydate(-44, 3, forward_precision=Precision(2, PrecisionUnit.Day))
+        unpickled = pickle.loads(pickle.dumps(fdate))
+        self.assertEqual(
+            (unpickled.year, unpickled.month, unpickled.day), (-44, 3, None)
+        )
+        self.assertIs(unpickled.forward_precision, fdate.forward_precision)
+        self.assertIs(unpickled.backward_precision, fdate.backward_precision)
+        self.assertEqual(unpickled.to_alldateperiod(), fdate.to_alldateperiod())
+        self.assertTrue(unpickled.overlap_with(fdate))
+        self.assertIs(copy.copy(fdate), fdate)
+        self.assertIs(copy.deepcopy([fdate])[0], fdate)
+        precision = Precision(2, PrecisionUnit.Month)
+        self.assertIs(pickle.loads(pickle.dumps(precision)), precision)
+
+    def test_cached_bounds(self):
+        fdate = fuzzydate(-44, 3, 15, precision=Precision(3, PrecisionUnit.Month))
+        self.assertIs(fdate.to_alldateperiod(), fdate.to_alldateperiod())
+        rng = random.Random(17)
+        fdates = [
+            fuzzydate(
+                rng.choice([-2, -1, 1, 2]),
+                rng.randint(1, 12),
+                rng.randint(1, 28),
+                precision=Precision(rng.randint(0, 40), PrecisionUnit.Day),
+            )
+            for _ in range(60)
+        ]
+        for fdate1 in fdates:
+            period1 = fdate1.to_alldateperiod()
+            for fdate2 in fdates:
+                self.assertEqual(
+                    fdate1.overlap_with(fdate2),
+                    period1.overlap_with(fdate2.to_alldateperiod()),
+                )
+
+
+class TestFuzzyDateIndex(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(18)
+        self.dates = []
+        for _ in range(400):
+            year = rng.choice([-3, -2, -1, 1, 2, 3])
+            month = rng.choice([None, rng.randint(1, 12)])
+            day = rng.randint(1, 28) if month and rng.random() < 0.5 else None
+            precision = rng.choice(
+                [None, Precision(0, PrecisionUnit.Day), Precision(9, PrecisionUnit.Day)]
+            )
+            self.dates.append(fuzzydate(year, month, day, precision=precision))
+        self.index = fuzzydateindex(self.dates[:300])
+        for date in self.dates[300:]:
+            self.index.insert(date)
+
+    def _ranges(self, dates):
+        return sorted((d._start, d._end, id(d)) for d in dates)
+
+    def _check(self, query, start, end):
+        overlapping = [
+            d for d in self.dates if not (d._end <= start or d._start >= end)
+        ]
+        covering = [d for d in self.dates if d._start <= start and d._end >= end]
+        within = [d for d in self.dates if d._start >= start and d._end <= end]
+        self.assertEqual(
+            self._ranges(self.index.overlapping(query)), self._ranges(overlapping)
+        )
+        self.assertEqual(
+            self._ranges(self.index.covering(query)), self._ranges(covering)
+        )
+        self.assertEqual(self._ranges(self.index.within(query)), self._ranges(within))
+
+    def test_queries(self):
+        self.assertEqual(len(self.index), len(self.dates))
+        self.assertEqual(self._ranges(self.index), self._ranges(self.dates))
+        for date in self.dates[::20]:
+            self._check(date, date._start, date._end)
+        period = fuzzydateperiod(fuzzydate(-1, 6), fuzzydate(2, 2))
+        self._check(period, period.start_date._start, period.end_date._end)
+        day = alldate(1, 3, 1)
+        self._check(day, day.toordinal(), day.toordinal() + 1)
+        self._check(
+            alldateperiod(alldate(-2, 1, 1), alldate(1, 1, 1)),
+            alldate(-2, 1, 1).toordinal(),
+            alldate(1, 1, 1).toordinal(),
+        )
+        with self.assertRaises(ValueError):
+            self.index.overlapping(2023)
+
+    def test_remove(self):
+        for date in self.dates[::2]:
+            self.index.remove(date)
+        self.dates = self.dates[1::2]
+        self.assertEqual(len(self.index), len(self.dates))
+        self._check(fuzzydate(1), fuzzydate(1)._start, fuzzydate(1)._end)
+        with self.assertRaises(ValueError):
+            self.index.remove(fuzzydate(1))
+        with self.assertRaises(ValueError):
+            self.index.insert(alldate(1, 1, 1))
+
+
+class TestOverlapJoin(unittest.TestCase):
+    def _dates(self, seed, count):
+        rng = random.Random(seed)
+        dates = []
+        for _ in range(count):
+            date = fuzzydate(
+                rng.choice([-1, 1, 2]),
+                rng.randint(1, 12),
+                rng.randint(1, 28),
+                forward_precision=Precision(rng.randint(0, 30), PrecisionUnit.Day),
+                backward_precision=Precision(rng.randint(0, 30), PrecisionUnit.Day),
+            )
+            dates.append(date)
+        return dates
+
+    def test_join(self):
+        left = self._dates(19, 150)
+        right = self._dates(20, 120) + [
+            fuzzydateperiod(fuzzydate(1, 1), fuzzydate(1, 3)),
+            fuzzydateperiod(fuzzydate(-1), fuzzydate(2)),
+        ]
+
+        def ranges(value):
+            if isinstance(value, fuzzydateperiod):
+                return value.start_date._start, value.end_date._end
+            return value._start, value._end
+
+        for min_overlap_days in [0, 1, 10]:
+            expected = set()
+            for i, a in enumerate(left):
+                for j, b in enumerate(right):
+                    (a_start, a_end), (b_start, b_end) = ranges(a), ranges(b)
+                    if a_end <= b_start or a_start >= b_end:
+                        continue
+                    if min(a_end, b_end) - max(a_start, b_start) >= min_overlap_days:
+                        expected.add((i, j))
+            pairs = list(overlap_join(left, right, min_overlap_days, indices=True))
+            self.assertEqual(len(pairs), len(expected))
+            self.assertEqual(set(pairs), expected)
+        pairs = list(overlap_join(left, right))
+        self.assertEqual(
+            {(id(a), id(b)) for a, b in pairs},
+            {
+                (id(left[i]), id(right[j]))
+                for i, j in overlap_join(left, right, indices=True)
+            },
+        )
+        for a, b in pairs:
+            if isinstance(b, fuzzydate):
+                self.assertTrue(a.overlap_with(b))
+        with self.assertRaises(ValueError):
+            list(overlap_join([alldate(1, 1, 1)], left))
@@ -0,0 +1,70 @@
+import unittest
+
+from alldatetime.alldatearray import alldatearray
+from alldatetime.alldatetime import alldate, alldateperiod, alldatetime
+from alldatetime.fuzzydatetime import Precision, PrecisionUnit, fuzzydate
+from alldatetime.records import pack_many, record_size, unpack_many
+
+
+class TestRecords(unittest.TestCase):
+    def test_alldate(self):
+        dates = [alldate(1, 1, 1), alldate(-1, 12, 31), alldate(-123456789, 2, 3)]
+        data = pack_many(dates, alldate)
+        self.assertEqual(len(data), 3 * record_size(alldate))
+        self.assertEqual(data[:16], bytes(8) + b"\xff" * 8)
+        self.assertEqual(unpack_many(data, alldate), dates)
+        self.assertEqual(pack_many(alldatearray(dates), alldate), data)
+        self.assertEqual(unpack_many(memoryview(data), alldate), dates)
+        self.assertEqual(unpack_many(b"", alldate), [])
+
+    def test_alldatetime(self):
+        values = [
+            alldatetime(1970, 1, 1),
+            alldatetime(-44, 3, 15, 12, 30, 5, 999999),
+            alldatetime(99999, 12, 31, 23, 59, 59, 1),
+        ]
+        data = pack_many(values, alldatetime)
+        self.assertEqual(len(data), 3 * record_size(alldatetime))
+        self.assertEqual(unpack_many(data, alldatetime), values)
+        with self.assertRaises(ValueError):
+            unpack_many(bytes(8) + b"\xff" * 8, alldatetime)
+
+    def test_alldateperiod(self):
+        periods = [
+            alldateperiod(alldate(-1, 1, 1), alldate(1, 1, 1)),
+            alldateperiod(alldate(2023, 5, 1), alldate(2023, 5, 1)),
+        ]
+        data = pack_many(periods, alldateperiod)
+        self.assertEqual(unpack_many(data, alldateperiod), periods)
+
+    def test_fuzzydate(self):
+        dates = [
+            fuzzydate(1912),
+            fuzzydate(-44, 3),
+            fuzzydate(2023, 1, 1, precision=Precision(2, PrecisionUnit.Day)),
+        ]
+        data = pack_many(dates, fuzzydate)
+        self.assertEqual(len(data), 3 * record_size(fuzzydate))
+        for date, unpacked in zip(dates, unpack_many(data, fuzzydate)):
+            self.assertEqual(
+                (unpacked.year, unpacked.month, unpacked.day),
+                (date.year, date.month, date.day),
+            )
+            self.assertIs(unpacked.forward_precision, date.forward_precision)
+            self.assertIs(unpacked.backward_precision, date.backward_precision)
+            self.assertEqual(unpacked.to_alldateperiod(), date.to_alldateperiod())
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            record_size(int)
+        with self.assertRaises(ValueError):
+            pack_many([alldate(1, 1, 1)], alldatetime)
+        with self.assertRaises(ValueError):
+            unpack_many(bytes(12), alldate)
+        with self.assertRaises(OverflowError):
+            pack_many([alldate(10**17, 1, 1)], alldate)
+        with self.assertRaises(OverflowError):
+            pack_many([fuzzydate(10**19)], fuzzydate)
+        fractional = fuzzydate(2023, 1, 1, precision=Precision(2.5, PrecisionUnit.Day))
+        with self.assertRaises(ValueError):
+            pack_many([fractional], fuzzydate)
@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from alldatetime.alldatetime import alldate, alldatetime
+from alldatetime.fuzzydatetime import fuzzydate
+from alldatetime.streaming import aparse_dates
+
+
+class _Reader:
+    "A stream returning its data in small chunks, like asyncio.StreamReader."
+
+    def __init__(self, data):
+        self.data = data
+
+    async def read(self, n):
+        chunk, self.data = self.data[:7], self.data[7:]
+        return chunk
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _collect(stream, **kwargs):
+    async def run():
+        values = []
+        async for batch in aparse_dates(stream, **kwargs):
+            values.extend(batch)
+        return values
+
+    return asyncio.run(run())
+
+
+class TestAParseDates(unittest.TestCase):
+    def test_csv(self):
+        dates = [alldate.fromordinal(n) for n in range(-1000, 1000, 3)]
+        data = "id,date\r\n" + "".join(
+            "%d,%s\r\n" % (i, date.isoformat()) for i, date in enumerate(dates)
+        )
+        self.assertEqual(
+            _collect(_Reader(data.encode()), column="date", batch_size=50), dates
+        )
+        lines = data.splitlines()[1:]
+        self.assertEqual(_collect(_chunks("\n".join(lines)), column=1), dates)
+
+    def test_csv_multiline_fields(self):
+        dates = [alldate(2023, 1, day) for day in range(1, 11)]
+        data = 'note,date\n' + "".join(
+            '"line %d\nsaid ""hi""\n",%s\n' % (i, date.isoformat())
+            for i, date in enumerate(dates)
+        )
+        self.assertEqual(
+            _collect(_Reader(data.encode()), column="date", batch_size=4), dates
+        )
+
+    def test_kinds_and_formats(self):
+        data = "2023-12-15 10:30\n\n-0044-03-15 12:00\n"
+        self.assertEqual(
+            _collect(_Reader(data), kind=alldatetime),
+            [alldatetime(2023, 12, 15, 10, 30), None, alldatetime(-44, 3, 15, 12)],
+        )
+        data = "15/12/2023\n15/03/0044 BC"
+        self.assertEqual(
+            _collect(_chunks(data.encode()), format="%d/%m/%Y"),
+            [alldate(2023, 12, 15), alldate(-44, 3, 15)],
+        )
+        values = _collect(_chunks("1912\n", "-44-03\n1912-03-05\n"), kind=fuzzydate)
+        self.assertEqual(
+            [(value.year, value.month, value.day) for value in values],
+            [(1912, None, None), (-44, 3, None), (1912, 3, 5)],
+        )
+
+    def test_ndjson(self):
+        data = '{"when": "2023-01-02", "n": 1}\n{"n": 2}\n{"when": "-0001-12-31"}\n'
+        self.assertEqual(
+            _collect(_chunks(data), column="when", layout="ndjson"),
+            [alldate(2023, 1, 2), None, alldate(-1, 12, 31)],
+        )
+
+    def test_process_pool(self):
+        dates = [alldate.fromordinal(n) for n in range(500)]
+        data = "\n".join(date.isoformat() for date in dates)
+        with ProcessPoolExecutor(2) as executor:
+            values = _collect(
+                _Reader(data), executor=executor, batch_size=64, max_pending=4
+            )
+        self.assertEqual(values, dates)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            _collect(_chunks("2023-13-01\n"))
+        with self.assertRaises(ValueError):
+            _collect(_chunks("a,b\n"), column="date")
+        with self.assertRaises(ValueError):
+            _collect(_chunks(""), kind=int)
+        with self.assertRaises(ValueError):
+            _collect(_chunks(""), column=1, layout="ndjson")
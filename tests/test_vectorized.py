@@ -0,0 +1,62 @@
+import unittest
+
+from alldatetime import vectorized
+from alldatetime.alldatetime import _is_leap, _ord2ymd, _ymd2ord
+
+
+@unittest.skipUnless(vectorized.available, "numpy is not installed")
+class TestVectorized(unittest.TestCase):
+    def test_ymd_to_ordinal(self):
+        import numpy as np
+
+        ymds = [
+            (1, 1, 1),
+            (1, 12, 31),
+            (1600, 12, 31),
+            (2023, 12, 14),
+            (-1, 12, 31),
+            (-1, 1, 1),
+            (-5, 12, 31),
+            (-4001, 2, 29),
+            (12345, 6, 7),
+        ]
+        years, months, days = (np.array(column) for column in zip(*ymds))
+        ordinals, valid = vectorized.ymd_to_ordinal(years, months, days)
+        self.assertTrue(valid.all())
+        self.assertEqual(ordinals.tolist(), [_ymd2ord(*ymd) for ymd in ymds])
+
+        _, valid = vectorized.ymd_to_ordinal(
+            [0, 2001, 2000, 2000, 2000, 2000, 10**17],
+            [1, 2, 2, 0, 13, 4, 1],
+            [1, 29, 29, 1, 1, 31, 1],
+        )
+        self.assertEqual(
+            valid.tolist(), [False, False, True, False, False, False, False]
+        )
+
+        with self.assertRaises(TypeError):
+            vectorized.ymd_to_ordinal([2000.5], [1], [1])
+
+    def test_ordinal_to_ymd(self):
+        import numpy as np
+
+        ordinals = np.concatenate(
+            [
+                np.arange(-150000, 150000, dtype=np.int64),
+                np.array([-(10**15), 10**15, 4508710, -1461277], dtype=np.int64),
+            ]
+        )
+        years, months, days = vectorized.ordinal_to_ymd(ordinals)
+        self.assertEqual(
+            list(zip(years.tolist(), months.tolist(), days.tolist())),
+            [_ord2ymd(n) for n in ordinals.tolist()],
+        )
+        roundtrip, valid = vectorized.ymd_to_ordinal(years, months, days)
+        self.assertTrue(valid.all())
+        self.assertTrue((roundtrip == ordinals).all())
+
+    def test_is_leap(self):
+        years = [y for y in range(-1000, 1000) if y != 0]
+        self.assertEqual(
+            vectorized.is_leap(years).tolist(), [bool(_is_leap(y)) for y in years]
+        )